@@ -0,0 +1 @@
+# Lets pytest import the hub package from the repository root.
@@ -0,0 +1,177 @@
+# --- Materialized dashboard counters, kept in the store's own transactions ---
+# ``aggregates`` holds the global counts; ``partition_stats`` holds the same
+# counts per (month, department) partition and doubles as the partition catalog.
+DIMENSIONS = ["Status", "Priority", "Category", "Department", "Sentiment"]
+TOTAL = ("Total", "")
+
+
+def create_table(conn):
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS aggregates (
+            dimension TEXT NOT NULL,
+            value TEXT NOT NULL,
+            count INTEGER NOT NULL,
+            PRIMARY KEY (dimension, value)
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS partition_stats (
+            month TEXT NOT NULL,
+            department TEXT NOT NULL,
+            dimension TEXT NOT NULL,
+            value TEXT NOT NULL,
+            count INTEGER NOT NULL,
+            PRIMARY KEY (month, department, dimension, value)
+        )
+    """)
+
+
+def partition_key(record):
+    return record.get("Month") or "", record.get("Department") or ""
+
+
+def _bump(conn, deltas):
+    """``deltas`` maps (partition, dimension, value) to a count change."""
+    global_deltas = {}
+    for (_, dimension, value), delta in deltas.items():
+        global_deltas[(dimension, value)] = global_deltas.get((dimension, value), 0) + delta
+    conn.executemany(
+        "INSERT INTO aggregates (dimension, value, count) VALUES (?, ?, ?) "
+        "ON CONFLICT(dimension, value) DO UPDATE SET count = count + excluded.count",
+        [(dimension, value, delta) for (dimension, value), delta in global_deltas.items() if delta]
+    )
+    conn.executemany(
+        "INSERT INTO partition_stats (month, department, dimension, value, count) "
+        "VALUES (?, ?, ?, ?, ?) ON CONFLICT(month, department, dimension, value) "
+        "DO UPDATE SET count = count + excluded.count",
+        [(month, department, dimension, value, delta)
+         for ((month, department), dimension, value), delta in deltas.items() if delta]
+    )
+
+
+def _add(deltas, partition, dimension, value, delta):
+    key = (partition, dimension, value or "")
+    deltas[key] = deltas.get(key, 0) + delta
+
+
+def apply_insert(conn, records):
+    deltas = {}
+    for record in records:
+        partition = partition_key(record)
+        _add(deltas, partition, *TOTAL, 1)
+        for dimension in DIMENSIONS:
+            _add(deltas, partition, dimension, record.get(dimension), 1)
+    _bump(conn, deltas)
+
+
+def apply_change(conn, partition, dimension, old, new):
+    old, new = old or "", new or ""
+    if old != new:
+        _bump(conn, {(partition, dimension, old): -1, (partition, dimension, new): 1})
+
+
+def apply_moves(conn, dimension, moved, new):
+    """``moved`` maps (partition, old value) to how many rows now have ``new``."""
+    deltas = {}
+    for (partition, old), count in moved.items():
+        if (old or "") != (new or ""):
+            _add(deltas, partition, dimension, old, -count)
+            _add(deltas, partition, dimension, new, count)
+    _bump(conn, deltas)
+
+
+def _counts(rows):
+    counts = {dimension: {} for dimension in DIMENSIONS}
+    counts["Total"] = 0
+    for dimension, value, count in rows:
+        if not count:
+            continue
+        if (dimension, value) == TOTAL:
+            counts["Total"] += count
+        else:
+            bucket = counts.setdefault(dimension, {})
+            bucket[value] = bucket.get(value, 0) + count
+    return counts
+
+
+def read(conn, months=None, departments=None):
+    """Global counters, or the sum over the selected partitions."""
+    if not months and not departments:
+        return _counts(conn.execute("SELECT dimension, value, count FROM aggregates"))
+    clauses, params = [], []
+    if months:
+        clauses.append(f"month IN ({', '.join('?' for _ in months)})")
+        params.extend(months)
+    if departments:
+        clauses.append(f"department IN ({', '.join('?' for _ in departments)})")
+        params.extend(departments)
+    return _counts(conn.execute(
+        f"SELECT dimension, value, SUM(count) FROM partition_stats "
+        f"WHERE {' AND '.join(clauses)} GROUP BY dimension, value", params
+    ))
+
+
+def _compute_partitions(conn):
+    """Per-partition counts recounted from the complaints table."""
+    rows = [(month, department, *TOTAL, count) for month, department, count in conn.execute(
+        "SELECT COALESCE(Month, ''), COALESCE(Department, ''), COUNT(*) FROM complaints "
+        "GROUP BY 1, 2"
+    )]
+    for dimension in DIMENSIONS:
+        rows += conn.execute(
+            f"SELECT COALESCE(Month, ''), COALESCE(Department, ''), ?, "
+            f"COALESCE({dimension}, ''), COUNT(*) FROM complaints GROUP BY 1, 2, 4",
+            (dimension,)
+        ).fetchall()
+    return rows
+
+
+def _archived_partitions(conn):
+    return conn.execute(
+        "SELECT month, department, dimension, value, count FROM partition_stats "
+        "WHERE month IN (SELECT month FROM partition_archives)"
+    ).fetchall()
+
+
+def compute(conn):
+    """Recount every dimension from the complaints table.
+
+    Archived partitions no longer have rows in the table, so their counts
+    are taken from the catalog.
+    """
+    rows = _compute_partitions(conn) + _archived_partitions(conn)
+    return _counts((dimension, value, count) for _, _, dimension, value, count in rows)
+
+
+def rebuild(conn):
+    archived = _archived_partitions(conn)
+    hot = _compute_partitions(conn)
+    conn.execute("DELETE FROM aggregates")
+    conn.execute(
+        "DELETE FROM partition_stats WHERE month NOT IN "
+        "(SELECT month FROM partition_archives)"
+    )
+    conn.executemany(
+        "INSERT INTO partition_stats (month, department, dimension, value, count) "
+        "VALUES (?, ?, ?, ?, ?)", hot
+    )
+    counts = _counts((dimension, value, count) for _, _, dimension, value, count in hot + archived)
+    global_rows = [(*TOTAL, counts["Total"])] + [
+        (dimension, value, count)
+        for dimension in DIMENSIONS for value, count in counts[dimension].items()
+    ]
+    conn.executemany("INSERT INTO aggregates (dimension, value, count) VALUES (?, ?, ?)", global_rows)
+    return counts
+
+
+def diff(stored, rebuilt):
+    """List of (dimension, value, stored, rebuilt) for every mismatching counter."""
+    mismatches = []
+    if stored["Total"] != rebuilt["Total"]:
+        mismatches.append(("Total", "", stored["Total"], rebuilt["Total"]))
+    for dimension in DIMENSIONS:
+        left, right = stored.get(dimension, {}), rebuilt.get(dimension, {})
+        for value in sorted(set(left) | set(right)):
+            if left.get(value, 0) != right.get(value, 0):
+                mismatches.append((dimension, value, left.get(value, 0), right.get(value, 0)))
+    return mismatches
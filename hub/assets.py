@@ -0,0 +1,227 @@
+# --- Static assets, built once per process ---
+CSS = """
+    <style>
+        .main {
+            background: linear-gradient(135deg, #f4f7fb 0%, #e8eef6 100%);
+            font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif;
+            color: #1e293b;
+        }
+
+        .stButton button {
+            background: linear-gradient(90deg, #2563eb, #1e40af);
+            color: #ffffff !important;
+            border: none;
+            border-radius: 8px;
+            padding: 0.9rem 2rem;
+            font-weight: 600;
+            font-size: 1rem;
+            transition: all 0.3s ease;
+            box-shadow: 0 6px 20px rgba(37,99,235,0.25);
+        }
+
+        .stButton button:hover {
+            background: linear-gradient(90deg, #1d4ed8, #1e3a8a);
+            color: #ffffff !important;
+            transform: scale(1.05);
+            box-shadow: 0 8px 30px rgba(37,99,235,0.4);
+        }
+
+        .main-header {
+            font-size: 3rem;
+            font-weight: 700;
+            color: #1e40af;
+            text-align: center;
+            margin-bottom: 1rem;
+            animation: fadeIn 1.5s ease-in;
+        }
+
+        .sub-header {
+            font-size: 1.4rem;
+            color: #666666;
+            text-align: center;
+            margin-bottom: 3rem;
+            font-weight: 400;
+            line-height: 1.5;
+        }
+
+        .mission-text {
+            font-size: 1.1rem;
+            color: #444444;
+            text-align: center;
+            margin: 2rem 0;
+            line-height: 1.6;
+            max-width: 800px;
+            margin-left: auto;
+            margin-right: auto;
+        }
+
+        .action-container {
+            display: flex;
+            justify-content: center;
+            gap: 1.5rem;
+            margin: 3rem 0;
+            flex-wrap: wrap;
+        }
+        
+        .action-button {
+            background: #000000;
+            color: white;
+            border: none;
+            border-radius: 10px;
+            padding: 1.2rem 2.5rem;
+            font-weight: 600;
+            font-size: 1.1rem;
+            cursor: pointer;
+            transition: all 0.3s ease;
+            text-decoration: none;
+            display: inline-block;
+            text-align: center;
+            min-width: 200px;
+        }
+        
+        .action-button:hover {
+            background: #333333;
+            transform: translateY(-2px);
+            box-shadow: 0 8px 25px rgba(0,0,0,0.15);
+        }
+
+        .section-title {
+            font-size: 2rem;
+            font-weight: 600;
+            color: #000000;
+            text-align: center;
+            margin-bottom: 2rem;
+        }
+
+        .clean-card {
+            background: white;
+            border-radius: 12px;
+            padding: 2.5rem;
+            border: 1px solid #f0f0f0;
+            box-shadow: 0 2px 12px rgba(0,0,0,0.08);
+            margin-bottom: 2rem;
+        }
+
+        .status-pending { 
+            background: #fff3cd; 
+            color: #856404; 
+            padding: 0.4rem 1rem; 
+            border-radius: 20px; 
+            font-weight: 500; 
+            font-size: 0.8rem;
+        }
+        .status-resolved { 
+            background: #d4edda; 
+            color: #155724; 
+            padding: 0.4rem 1rem; 
+            border-radius: 20px; 
+            font-weight: 500; 
+            font-size: 0.8rem;
+        }
+        .status-progress { 
+            background: #dbeafe; 
+            color: #1e40af; 
+            padding: 0.4rem 1rem; 
+            border-radius: 20px; 
+            font-weight: 500; 
+            font-size: 0.8rem;
+        }
+        .status-high { 
+            background: #f8d7da; 
+            color: #721c24; 
+            padding: 0.4rem 1rem; 
+            border-radius: 20px; 
+            font-weight: 500; 
+            font-size: 0.8rem;
+        }
+        .status-medium { 
+            background: #fff3cd; 
+            color: #856404; 
+            padding: 0.4rem 1rem; 
+            border-radius: 20px; 
+            font-weight: 500; 
+            font-size: 0.8rem;
+        }
+        .status-low { 
+            background: #d1ecf1; 
+            color: #0c5460; 
+            padding: 0.4rem 1rem; 
+            border-radius: 20px; 
+            font-weight: 500; 
+            font-size: 0.8rem;
+        }
+
+        @keyframes fadeIn {
+            from {opacity: 0; transform: translateY(20px);}
+            to {opacity: 1; transform: translateY(0);}
+        }
+    </style>
+"""
+
+# --- Text dictionary ---
+text = {
+    "English": {
+        "home": "Home",
+        "submit": "Submit Complaint", 
+        "track": "Track Complaint",
+        "dashboard": "Dashboard", 
+        "chatbot": "Assistant",
+        "metrics": "Metrics",
+        "title": "Digital Citizen Hub – Balochistan",
+        "subtitle": "AI-powered platform transforming governance",
+        "mission": "Automating complaints, tracking status, and enhancing transparency in government services.",
+        "submit_title": "Submit a Complaint", 
+        "name": "Full Name",
+        "category": "Complaint Type", 
+        "description": "Describe your issue",
+        "image": "Upload an optional image", 
+        "submit_btn": "Submit Complaint",
+        "success": "Your complaint has been submitted! Tracking ID:",
+        "duplicate": "A similar complaint has already been reported; yours is linked to it so both are handled together:",
+        "track_title": "Track Your Complaint", 
+        "track_input": "Enter your Complaint ID",
+        "track_btn": "Check Status", 
+        "dashboard_title": "Transparency Dashboard",
+        "dashboard_desc": "Overview of complaints in the system.",
+        "footer": "Empowering governance through AI and transparency",
+        "resolved_btn": "Mark as Resolved", 
+        "priority": "Priority",
+        "status": "Status", 
+        "department": "Department", 
+        "role": "Select Role",
+        "admin_pass": "Enter Admin Password",
+        "features": "Platform Features"
+    },
+    "اردو": {
+        "home": "ہوم",
+        "submit": "شکایت درج کریں", 
+        "track": "شکایت ٹریک کریں",
+        "dashboard": "ڈیش بورڈ", 
+        "chatbot": "معاون",
+        "metrics": "میٹرکس",
+        "title": "ڈیجیٹل سٹیزن حب – بلوچستان",
+        "subtitle": "بلوچستان میں گورننس کو بہتر بنانے کے لیے مصنوعی ذہانت سے چلنے والا پلیٹ فارم۔",
+        "mission": "شکایات کو خودکار کرنا، ان کی حالت ٹریک کرنا اور سرکاری خدمات میں شفافیت بڑھانا۔",
+        "submit_title": "شکایت درج کریں", 
+        "name": "نام",
+        "category": "شکایت کی قسم", 
+        "description": "مسئلہ بیان کریں",
+        "image": "اختیاری تصویر اپ لوڈ کریں", 
+        "submit_btn": "شکایت جمع کریں",
+        "success": "آپ کی شکایت موصول ہو گئی! ٹریکنگ آئی ڈی:",
+        "duplicate": "ایسی ہی شکایت پہلے درج ہو چکی ہے؛ آپ کی شکایت اس سے منسلک کر دی گئی ہے تاکہ دونوں پر ایک ساتھ کارروائی ہو:",
+        "track_title": "شکایت ٹریک کریں", 
+        "track_input": "اپنی شکایت کی آئی ڈی درج کریں",
+        "track_btn": "حالت چیک کریں", 
+        "dashboard_title": "شفافیت کا ڈیش بورڈ",
+        "dashboard_desc": "سسٹم میں شکایات کا جائزہ۔",
+        "footer": "مصنوعی ذہانت اور شفافیت کے ذریعے گورننس کو مضبوط بنانا",
+        "resolved_btn": "حل شدہ نشان زد کریں", 
+        "priority": "اہمیت",
+        "status": "حالت", 
+        "department": "ڈیپارٹمنٹ", 
+        "role": "کردار منتخب کریں",
+        "admin_pass": "ایڈمن پاس ورڈ درج کریں",
+        "features": "پلیٹ فارم کی خصوصیات"
+    }
+}
@@ -0,0 +1,157 @@
+import math
+import re
+import threading
+from collections import OrderedDict
+
+# --- Bilingual FAQ corpus ---
+# Each entry lists sample questions/keywords in English and Urdu; the index is
+# built over those, and the answer is returned in the page language.
+FAQ = [
+    {
+        "questions": [
+            "how do I submit a complaint", "file register lodge new complaint report problem",
+            "شکایت کیسے درج کریں", "نئی شکایت جمع کرانا",
+        ],
+        "English": "You can submit complaints through the 'Submit Complaint' page. Provide your details and issue description.",
+        "اردو": "آپ 'شکایت درج کریں' کے صفحے سے شکایت جمع کرا سکتے ہیں۔ اپنا نام اور مسئلے کی تفصیل لکھیں۔",
+    },
+    {
+        "questions": [
+            "how do I track my complaint", "check status of complaint tracking id",
+            "شکایت ٹریک کریں", "میری شکایت کی حالت کیا ہے", "ٹریکنگ آئی ڈی",
+        ],
+        "English": "Use the 'Track Complaint' page with your complaint ID to check current status and updates. You can also ask me \"what is the status of complaint <ID>?\".",
+        "اردو": "اپنی شکایت کی آئی ڈی کے ساتھ 'شکایت ٹریک کریں' کا صفحہ استعمال کریں، یا مجھ سے پوچھیں: \"شکایت <آئی ڈی> کی حالت کیا ہے؟\"",
+    },
+    {
+        "questions": [
+            "which departments do you handle", "department electricity qesco water health roads sanitation",
+            "کون سے محکمے", "ڈیپارٹمنٹ بجلی پانی صحت سڑکیں صفائی",
+        ],
+        "English": "We handle complaints for Electricity (QESCO), Water, Health, Roads, Sanitation departments.",
+        "اردو": "ہم بجلی (کیسکو)، پانی، صحت، سڑکوں اور صفائی کے محکموں کی شکایات وصول کرتے ہیں۔",
+    },
+    {
+        "questions": [
+            "how is priority decided", "why is my complaint high medium low priority urgent",
+            "اہمیت کیسے طے ہوتی ہے", "فوری شکایت",
+        ],
+        "English": "Priority is detected automatically from your description. Words like 'urgent', 'fire' or 'flood' mark a complaint High; 'delay', 'broken' or 'problem' mark it Medium.",
+        "اردو": "اہمیت آپ کی تفصیل سے خودبخود طے ہوتی ہے۔ 'فوری'، 'آگ' یا 'سیلاب' جیسے الفاظ شکایت کو زیادہ اہم بناتے ہیں۔",
+    },
+    {
+        "questions": [
+            "how long does resolution take", "when will my complaint be resolved fixed time",
+            "in progress pending resolved meaning",
+            "شکایت کب حل ہوگی", "زیر کارروائی کا مطلب",
+        ],
+        "English": "Complaints move from Pending to In Progress when a department picks them up, and to Resolved when the issue is fixed. High priority complaints are handled first.",
+        "اردو": "شکایت پہلے زیر التوا ہوتی ہے، محکمہ کام شروع کرے تو زیر کارروائی، اور مسئلہ حل ہونے پر حل شدہ ہو جاتی ہے۔ زیادہ اہم شکایات پہلے دیکھی جاتی ہیں۔",
+    },
+    {
+        "questions": [
+            "can I upload a photo image picture", "attach evidence",
+            "تصویر اپ لوڈ", "تصویر لگانا",
+        ],
+        "English": "Yes. The complaint form accepts an optional JPG or PNG image of the issue.",
+        "اردو": "جی ہاں۔ شکایت کے فارم میں آپ مسئلے کی JPG یا PNG تصویر لگا سکتے ہیں۔",
+    },
+    {
+        "questions": [
+            "change language urdu english", "زبان تبدیل کریں اردو",
+        ],
+        "English": "Use the 'Language / زبان' selector in the sidebar to switch between English and Urdu.",
+        "اردو": "زبان بدلنے کے لیے سائیڈ بار میں 'Language / زبان' استعمال کریں۔",
+    },
+]
+
+FALLBACK = {
+    "English": "I can help with complaint submission, tracking, department information, and general guidance.",
+    "اردو": "میں شکایت درج کرنے، ٹریک کرنے، محکموں کی معلومات اور عمومی رہنمائی میں مدد کر سکتا ہوں۔",
+}
+STATUS_ANSWER = {
+    "English": "Complaint #{ID} ({Department}, {Priority} priority) is currently **{Status}**.",
+    "اردو": "شکایت #{ID} ({Department}، اہمیت: {Priority}) کی موجودہ حالت: **{Status}**۔",
+}
+NOT_FOUND = {
+    "English": "I could not find complaint #{ID}. Please check the tracking ID.",
+    "اردو": "شکایت #{ID} نہیں ملی۔ براہ کرم ٹریکنگ آئی ڈی چیک کریں۔",
+}
+
+_TOKEN = re.compile(r"\w+")
+_TRACKING_ID = re.compile(r"(?<!\d)\d{9,16}(?!\d)")
+_URDU_DIGITS = str.maketrans("۰۱۲۳۴۵۶۷۸۹٠١٢٣٤٥٦٧٨٩", "01234567890123456789")
+# Too common to carry meaning in either language
+STOPWORDS = {
+    "the", "a", "an", "is", "are", "my", "i", "do", "to", "of", "what", "how", "can", "you",
+    "کی", "کے", "کا", "ہے", "میں", "سے", "کو", "کیا", "اور",
+}
+
+
+def tokenize(text_input):
+    return [t for t in _TOKEN.findall(text_input.lower()) if t not in STOPWORDS]
+
+
+class Bm25Index:
+    """Inverted BM25 index built once over small documents."""
+
+    def __init__(self, documents, k1=1.2, b=0.75):
+        self.k1, self.b = k1, b
+        self.postings = {}
+        self.lengths = []
+        for doc_id, document in enumerate(documents):
+            tokens = tokenize(document)
+            self.lengths.append(len(tokens))
+            for token in set(tokens):
+                self.postings.setdefault(token, []).append((doc_id, tokens.count(token)))
+        self.avg_length = sum(self.lengths) / max(len(self.lengths), 1)
+        n = len(self.lengths)
+        self.idf = {
+            token: math.log(1 + (n - len(posting) + 0.5) / (len(posting) + 0.5))
+            for token, posting in self.postings.items()
+        }
+
+    def search(self, query):
+        scores = {}
+        for token in set(tokenize(query)):
+            for doc_id, tf in self.postings.get(token, ()):
+                norm = tf + self.k1 * (1 - self.b + self.b * self.lengths[doc_id] / self.avg_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + self.idf[token] * tf * (self.k1 + 1) / norm
+        return max(scores.items(), key=lambda item: item[1]) if scores else (None, 0.0)
+
+
+class Assistant:
+    """Answers citizen questions from the FAQ index or the complaint store."""
+
+    def __init__(self, faq=FAQ, min_score=0.5, cache_size=1024):
+        self.faq = faq
+        self.min_score = min_score
+        self.index = Bm25Index([" ".join(entry["questions"]) for entry in faq])
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def faq_answer(self, question, lang):
+        key = (" ".join(tokenize(question)), lang)
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+        doc_id, score = self.index.search(question)
+        answer = self.faq[doc_id][lang] if doc_id is not None and score >= self.min_score else FALLBACK[lang]
+        with self._lock:
+            self._cache[key] = answer
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return answer
+
+    def answer(self, question, lang, lookup=None):
+        """``lookup(id)`` returns a complaint dict or None (e.g. store.get)."""
+        match = _TRACKING_ID.search(question.translate(_URDU_DIGITS))
+        if match and lookup is not None:
+            complaint_id = int(match.group())
+            complaint = lookup(complaint_id)
+            if complaint is None:
+                return NOT_FOUND[lang].format(ID=complaint_id)
+            return STATUS_ANSWER[lang].format(**complaint)
+        return self.faq_answer(question, lang)
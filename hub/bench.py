@@ -0,0 +1,222 @@
+import argparse
+import json
+import os
+import random
+import sqlite3
+import threading
+import time
+from contextlib import closing
+
+from hub.helpers import create_status_badge, department_mapping
+from hub.ids import IdGenerator
+from hub.priority import detect_priority
+from hub.status import RESOLVED
+from hub.storage import open_store
+from hub.writer import GroupCommitWriter
+
+CATEGORIES = list(department_mapping)
+PLACES = ["Satellite Town", "Jinnah Road", "Sariab", "Hazar Ganji", "Brewery Road", "Airport Road"]
+TEMPLATES = [
+    "No electricity in {place} since morning",
+    "Urgent: transformer on fire near {place}",
+    "Water supply delayed for three days in {place}",
+    "Broken road near {place} causing accidents",
+    "Garbage not collected in {place}, big problem",
+    "Hospital in {place} has no doctors, immediately needed",
+    "{place} میں صبح سے بجلی نہیں ہے",
+    "{place} میں پانی کی فراہمی میں تاخیر",
+    "{place} کی سڑک خراب ہے",
+]
+
+
+def parse_size(value):
+    value = value.strip().lower()
+    scale = {"k": 1000, "m": 1000000}.get(value[-1], 1)
+    return int(float(value[:-1] if scale > 1 else value) * scale)
+
+
+def synthetic_records(n, seed=0):
+    rng = random.Random(seed)
+    ids = IdGenerator(worker_id=15)
+    for _ in range(n):
+        category = rng.choice(CATEGORIES)
+        description = rng.choice(TEMPLATES).format(place=rng.choice(PLACES))
+        yield {
+            "ID": ids.next_id(), "Name": f"Citizen {rng.randrange(100000)}",
+            "Category": category, "Department": department_mapping[category],
+            "Priority": detect_priority(description), "Status": "Pending",
+            "Description": description, "Sentiment": "Neutral", "Image": None
+        }
+
+
+def _remove_db(path):
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+
+
+def build_dataset(path, n, batch_size=50000):
+    """Create (or reuse) a pristine synthetic store with exactly ``n`` complaints."""
+    store = open_store(path)
+    if store.count() not in (0, n):  # left over from a run that modified it
+        store.close()
+        _remove_db(path)
+        store = open_store(path)
+    missing = n - store.count()
+    batch = []
+    for record in synthetic_records(missing, seed=n):
+        batch.append(record)
+        if len(batch) >= batch_size:
+            store.append_many(batch)
+            batch = []
+    store.append_many(batch)
+    return store
+
+
+def working_copy(path):
+    """Fresh copy of a pristine dataset for the benchmarks that modify it."""
+    copy_path = os.path.splitext(path)[0] + ".run.db"
+    _remove_db(copy_path)
+    with closing(sqlite3.connect(path)) as source, closing(sqlite3.connect(copy_path)) as target:
+        source.backup(target)
+    return open_store(copy_path)
+
+
+def summarize(latencies, elapsed=None):
+    latencies = sorted(latencies)
+
+    def pct(p):
+        return latencies[min(len(latencies) - 1, int(p / 100 * len(latencies)))]
+
+    elapsed = elapsed if elapsed is not None else sum(latencies)
+    return {"ops": len(latencies), "ops_per_sec": len(latencies) / elapsed if elapsed else 0.0,
+            "p50_ms": pct(50) * 1000, "p95_ms": pct(95) * 1000, "p99_ms": pct(99) * 1000}
+
+
+def timed(fn, args_list):
+    latencies = []
+    for args in args_list:
+        start = time.perf_counter()
+        fn(*args)
+        latencies.append(time.perf_counter() - start)
+    return summarize(latencies)
+
+
+def bench_submit(store, n, threads=8):
+    """Concurrent submissions through the group-commit writer."""
+    writer = GroupCommitWriter(store)
+    records = list(synthetic_records(n, seed=time.time_ns()))
+    latencies = []
+    lock = threading.Lock()
+
+    def work(chunk):
+        local = []
+        for record in chunk:
+            start = time.perf_counter()
+            writer.insert(record).result()
+            local.append(time.perf_counter() - start)
+        with lock:
+            latencies.extend(local)
+
+    workers = [threading.Thread(target=work, args=(records[i::threads],)) for i in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+    writer.close()
+    return summarize(latencies, elapsed)
+
+
+def run(size, data_dir, samples=2000, seed=0):
+    rng = random.Random(seed)
+    os.makedirs(data_dir, exist_ok=True)
+    start = time.perf_counter()
+    path = os.path.join(data_dir, f"bench_{size}.db")
+    store = build_dataset(path, size)
+    scratch = working_copy(path)
+    print(f"[{size:,} complaints] dataset ready in {time.perf_counter() - start:.1f}s")
+
+    sample_ids = [row["ID"] for row in store.query(limit=samples, sort_by="ID",
+                                                   offset=rng.randrange(max(1, size - samples)))[0]]
+    descriptions = [rng.choice(TEMPLATES).format(place=rng.choice(PLACES)) for _ in range(samples)]
+    results = {
+        "detect_priority": timed(detect_priority, [(d,) for d in descriptions]),
+        "create_status_badge": timed(create_status_badge, [
+            (rng.choice(["Pending", "In Progress", "Resolved", None]),
+             rng.choice(["High", "Medium", "Low"])) for _ in range(samples)
+        ]),
+        "department_routing": timed(department_mapping.get, [
+            (rng.choice(CATEGORIES), "Other") for _ in range(samples)
+        ]),
+        "track_lookup": timed(store.get, [(rng.choice(sample_ids),) for _ in range(samples)]),
+        "dashboard_aggregates": timed(store.aggregates, [()] * min(samples, 500)),
+        "records_page": timed(lambda f: store.query(filters=f, limit=50), [
+            ({"Department": [rng.choice(list(department_mapping.values()))]},)
+            for _ in range(min(samples, 200))
+        ]),
+        # Modifying benchmarks run on a per-run copy so every run starts from Pending rows
+        "resolve": timed(scratch.update_status, [(i, RESOLVED) for i in sample_ids]),
+        "submit": bench_submit(scratch, min(samples, 5000)),
+    }
+    try:
+        from hub.sentiment import get_sentiment
+        # Unique texts so every call is scored by TextBlob, not served from the label cache
+        results["get_sentiment"] = timed(get_sentiment, [
+            (f"{d} (ref {time.time_ns()}-{i})",) for i, d in enumerate(descriptions[:500])
+        ])
+    except ImportError:
+        print("  (textblob not installed, skipping get_sentiment)")
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Regressions: p95 slower or throughput lower than baseline by > tolerance."""
+    regressions = []
+    for key, current in results.items():
+        previous = baseline.get(key)
+        if previous is None:
+            continue
+        if current["p95_ms"] > previous["p95_ms"] * (1 + tolerance):
+            regressions.append(f"{key}: p95 {previous['p95_ms']:.3f} -> {current['p95_ms']:.3f} ms")
+        if current["ops_per_sec"] < previous["ops_per_sec"] * (1 - tolerance):
+            regressions.append(
+                f"{key}: {previous['ops_per_sec']:,.0f} -> {current['ops_per_sec']:,.0f} ops/sec"
+            )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Complaint lifecycle benchmarks")
+    parser.add_argument("--sizes", default="10k", help="Comma separated, e.g. 10k,1m,10m")
+    parser.add_argument("--samples", type=int, default=2000)
+    parser.add_argument("--data-dir", default=".bench")
+    parser.add_argument("--baseline", default="bench_baseline.json")
+    parser.add_argument("--save", action="store_true", help="Write results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args()
+
+    results = {}
+    for size in (parse_size(s) for s in args.sizes.split(",")):
+        for name, stats in run(size, args.data_dir, args.samples).items():
+            results[f"{size}/{name}"] = stats
+            print(f"  {name:<22} {stats['ops_per_sec']:>12,.0f} ops/s  p50 {stats['p50_ms']:8.3f} ms"
+                  f"  p95 {stats['p95_ms']:8.3f} ms  p99 {stats['p99_ms']:8.3f} ms")
+
+    if args.save:
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        print(f"Saved baseline to {args.baseline}")
+    elif os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            raise SystemExit(1)
+        print(f"No regressions against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
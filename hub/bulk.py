@@ -0,0 +1,178 @@
+import argparse
+import csv
+import json
+import os
+import re
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+from hub import status as lifecycle
+from hub.helpers import category_translation, department_mapping
+from hub.ids import IdGenerator
+from hub.priority import default_classifier
+from hub.sentiment import PENDING, label_many
+from hub.storage import COLUMNS, open_store
+
+
+def read_records(path, fmt=None):
+    """Stream raw complaints from a CSV or JSONL file, one dict at a time."""
+    fmt = fmt or ("jsonl" if path.endswith((".jsonl", ".ndjson")) else "csv")
+    with open(path, newline="", encoding="utf-8") as f:
+        if fmt == "jsonl":
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from csv.DictReader(f)
+
+
+# "resolved", "IN_PROGRESS", "in-progress" ... -> the canonical lifecycle status
+_STATUS_NAMES = {re.sub(r"[\s_-]", "", status).lower(): status for status in lifecycle.STATUSES}
+
+
+def normalize_status(value):
+    """Canonical status for an imported value (blank means Pending); None if unknown."""
+    if not value:
+        return lifecycle.PENDING
+    return _STATUS_NAMES.get(re.sub(r"[\s_-]", "", str(value)).lower())
+
+
+def chunks(records, size):
+    chunk = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def enrich(rows, score_sentiment=True):
+    """Route, prioritize and score one chunk (runs in a worker process).
+
+    Rows whose Status is not a lifecycle status are dropped.
+    """
+    enriched = []
+    statuses = [normalize_status(row.get("Status")) for row in rows]
+    rows, statuses = [row for row, s in zip(rows, statuses) if s], [s for s in statuses if s]
+    descriptions = [row.get("Description") or "" for row in rows]
+    sentiments = label_many(descriptions) if score_sentiment else [PENDING] * len(rows)
+    priorities = default_classifier.classify_many(descriptions)
+    for row, status, description, sentiment, priority in zip(
+        rows, statuses, descriptions, sentiments, priorities
+    ):
+        category = row.get("Category") or "Other"
+        category = category_translation.get(category, category)
+        enriched.append({
+            "Name": row.get("Name"),
+            "Category": category,
+            "Department": row.get("Department") or department_mapping.get(category, "Other"),
+            "Priority": priority,
+            "Status": status,
+            "Description": description,
+            "Sentiment": sentiment,
+            "Image": row.get("Image") or None,
+        })
+    return enriched
+
+
+def import_file(store, path, fmt=None, chunk_size=50000, processes=None,
+                score_sentiment=True, id_generator=None):
+    """Stream ``path`` into the store with bounded memory.
+
+    Chunks are enriched on a process pool while earlier chunks are being
+    committed; at most two chunks per worker are in flight at once. Returns
+    (imported, rejected), where rejected rows had an unknown Status.
+    """
+    processes = processes or os.cpu_count() or 1
+    id_generator = id_generator or IdGenerator()
+    imported = rejected = 0
+    pending = deque()
+    with ProcessPoolExecutor(processes, mp_context=get_context("spawn")) as pool:
+        def commit_oldest():
+            nonlocal imported, rejected
+            size, future = pending.popleft()
+            rows = future.result()
+            for row in rows:
+                row["ID"] = id_generator.next_id()
+            store.append_many(rows)
+            imported += len(rows)
+            rejected += size - len(rows)
+
+        for chunk in chunks(read_records(path, fmt), chunk_size):
+            pending.append((len(chunk), pool.submit(enrich, chunk, score_sentiment)))
+            if len(pending) >= processes * 2:
+                commit_oldest()
+        while pending:
+            commit_oldest()
+    return imported, rejected
+
+
+def export_file(store, path, fmt=None, chunk_size=50000):
+    """Stream every stored complaint, compacted months included, to a CSV or JSONL file."""
+    fmt = fmt or ("jsonl" if path.endswith((".jsonl", ".ndjson")) else "csv")
+    exported = 0
+    after = 0
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=COLUMNS) if fmt == "csv" else None
+        if writer:
+            writer.writeheader()
+
+        def write(rows):
+            if writer:
+                writer.writerows(rows)
+            else:
+                f.writelines(json.dumps(row, ensure_ascii=False) + "\n" for row in rows)
+            return len(rows)
+
+        while True:
+            rows, after = store.load_since(after, limit=chunk_size)
+            if not rows:
+                break
+            exported += write(rows)
+        for rows in store.iter_archived(batch_size=chunk_size):
+            exported += write(rows)
+    os.replace(tmp_path, path)
+    return exported
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk complaint import/export")
+    parser.add_argument("--db", default="complaints.db")
+    sub = parser.add_subparsers(dest="command", required=True)
+    importer = sub.add_parser("import", help="Ingest a CSV/JSONL file of complaints")
+    importer.add_argument("path")
+    importer.add_argument("--format", choices=["csv", "jsonl"])
+    importer.add_argument("--chunk-size", type=int, default=50000)
+    importer.add_argument("--processes", type=int, default=None)
+    importer.add_argument("--skip-sentiment", action="store_true",
+                          help="Store sentiment as Pending; score it with "
+                               "'python -m hub.sentiment --pending' or on the app's next start")
+    exporter = sub.add_parser("export", help="Write all complaints to CSV/JSONL")
+    exporter.add_argument("path")
+    exporter.add_argument("--format", choices=["csv", "jsonl"])
+    exporter.add_argument("--chunk-size", type=int, default=50000)
+    args = parser.parse_args()
+
+    store = open_store(args.db)
+    start = time.perf_counter()
+    if args.command == "import":
+        count, rejected = import_file(store, args.path, args.format, args.chunk_size,
+                                      args.processes, score_sentiment=not args.skip_sentiment)
+        if rejected:
+            print(f"Skipped {rejected} rows with an unknown Status "
+                  f"(expected one of {', '.join(lifecycle.STATUSES)})")
+        verb = "Imported"
+    else:
+        count = export_file(store, args.path, args.format, args.chunk_size)
+        verb = "Exported"
+    elapsed = time.perf_counter() - start
+    print(f"{verb} {count} complaints in {elapsed:.1f}s ({count / elapsed if elapsed else 0:,.0f}/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+import threading
+from collections import OrderedDict
+
+import plotly.express as px
+
+from hub import metrics
+
+PRIORITY_ORDER = ["High", "Medium", "Low"]
+
+
+def category_pie(counts):
+    categories = counts["Category"]
+    return px.pie(
+        names=list(categories), values=list(categories.values()),
+        title="Complaints by Category"
+    )
+
+
+def priority_bar(counts):
+    priorities = counts["Priority"]
+    order = [p for p in PRIORITY_ORDER if p in priorities]
+    order += sorted(p for p in priorities if p not in PRIORITY_ORDER)
+    return px.bar(
+        x=order, y=[priorities[p] for p in order],
+        labels={"x": "Priority", "y": "count"}, title="Complaints by Priority"
+    )
+
+
+class FigureCache:
+    """Built figures keyed on the dataset version they were built from.
+
+    Figures are drawn from the aggregate counters, so their size depends on
+    the number of categories rather than the number of complaints, and they
+    are only rebuilt after the store changes. ``scope`` tells apart figures
+    of the same kind drawn for different dashboard scopes; the least
+    recently used ones are dropped beyond ``maxsize``.
+    """
+
+    def __init__(self, maxsize=32):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._figures = OrderedDict()
+        self.stats = {"hits": 0, "builds": 0}
+
+    def get(self, name, version, build, scope=None):
+        key = (name, scope)
+        with self._lock:
+            cached = self._figures.get(key)
+            if cached is not None and cached[0] == version:
+                self._figures.move_to_end(key)
+                self.stats["hits"] += 1
+                return cached[1]
+        with metrics.timer("figure_build_seconds", figure=name):
+            figure = build()
+        with self._lock:
+            self._figures[key] = (version, figure)
+            self._figures.move_to_end(key)
+            if len(self._figures) > self.maxsize:
+                self._figures.popitem(last=False)
+            self.stats["builds"] += 1
+        return figure
@@ -0,0 +1,170 @@
+import argparse
+import os
+import time
+
+from hub.storage import COLUMNS
+
+# Low-cardinality columns are stored dictionary-encoded and loaded as categoricals
+CATEGORICAL_COLUMNS = ["Category", "Department", "Priority", "Status", "Sentiment"]
+TEXT_COLUMNS = ["Name", "Description", "Image"]
+# What the dashboard needs; never touches the free-text columns
+DASHBOARD_COLUMNS = ["ID"] + CATEGORICAL_COLUMNS
+CSV_DTYPES = {"ID": "int64", **{col: "category" for col in CATEGORICAL_COLUMNS},
+              **{col: "object" for col in TEXT_COLUMNS}}
+
+
+def _pyarrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise RuntimeError("The columnar format needs pyarrow: pip install pyarrow") from None
+    return pa, pq
+
+
+def schema():
+    pa, _ = _pyarrow()
+    fields = []
+    for col in COLUMNS:
+        if col == "ID":
+            fields.append(pa.field(col, pa.int64()))
+        elif col in CATEGORICAL_COLUMNS:
+            fields.append(pa.field(col, pa.dictionary(pa.int32(), pa.string())))
+        else:
+            fields.append(pa.field(col, pa.string()))
+    return pa.schema(fields)
+
+
+def typed_frame(df):
+    """Cast a complaints DataFrame to the compact in-memory dtypes."""
+    return df.astype({col: dtype for col, dtype in CSV_DTYPES.items() if col in df.columns})
+
+
+def _write_frames(frames, parquet_path):
+    pa, pq = _pyarrow()
+    table_schema = schema()
+    rows = 0
+    tmp_path = parquet_path + ".tmp"
+    with pq.ParquetWriter(tmp_path, table_schema, compression="zstd") as out:
+        for df in frames:
+            df = typed_frame(df.reindex(columns=COLUMNS))
+            out.write_table(pa.Table.from_pandas(df, schema=table_schema, preserve_index=False))
+            rows += len(df)
+    os.replace(tmp_path, parquet_path)
+    return rows
+
+
+def csv_to_parquet(csv_path, parquet_path, chunksize=200000):
+    import pandas as pd
+
+    return _write_frames(pd.read_csv(csv_path, dtype=CSV_DTYPES, chunksize=chunksize), parquet_path)
+
+
+def store_to_parquet(store, parquet_path, chunksize=200000):
+    import pandas as pd
+
+    def frames():
+        after = 0
+        while True:
+            rows, after_next = store.load_since(after, limit=chunksize)
+            if not rows:
+                return
+            after = after_next
+            yield pd.DataFrame(rows, columns=COLUMNS)
+        for rows in store.iter_archived(batch_size=chunksize):
+            yield pd.DataFrame(rows, columns=COLUMNS)
+
+    return _write_frames(frames(), parquet_path)
+
+
+def records_to_parquet(batches, parquet_path):
+    """Write an iterable of record lists (dicts keyed by COLUMNS)."""
+    import pandas as pd
+
+    return _write_frames((pd.DataFrame(rows, columns=COLUMNS) for rows in batches), parquet_path)
+
+
+def parquet_to_csv(parquet_path, csv_path):
+    _, pq = _pyarrow()
+    tmp_path = csv_path + ".tmp"
+    header = True
+    with open(tmp_path, "w", newline="", encoding="utf-8") as out:
+        for batch in pq.ParquetFile(parquet_path).iter_batches():
+            batch.to_pandas().to_csv(out, index=False, header=header)
+            header = False
+    os.replace(tmp_path, csv_path)
+
+
+def iter_records(parquet_path, batch_size=50000):
+    """Yield the file's rows as lists of dicts keyed by COLUMNS."""
+    _, pq = _pyarrow()
+    for batch in pq.ParquetFile(parquet_path).iter_batches(batch_size=batch_size):
+        yield batch.to_pylist()
+
+
+def load(parquet_path, columns=None, filters=None):
+    """Read only ``columns`` (default all) into a typed DataFrame.
+
+    ``filters`` is passed to pyarrow, e.g. [("ID", "==", 123)], so row groups
+    that cannot match are skipped.
+    """
+    _pyarrow()
+    import pandas as pd
+
+    return pd.read_parquet(parquet_path, columns=columns, filters=filters)
+
+
+def compare(csv_path, parquet_path):
+    """File size, load time and in-memory size of both formats."""
+    import pandas as pd
+
+    def measure(label, path, loader):
+        start = time.perf_counter()
+        df = loader()
+        elapsed = time.perf_counter() - start
+        return {"format": label, "file_bytes": os.path.getsize(path), "load_seconds": elapsed,
+                "memory_bytes": int(df.memory_usage(deep=True).sum()), "rows": len(df)}
+
+    return [
+        measure("csv", csv_path, lambda: pd.read_csv(csv_path)),
+        measure("parquet", parquet_path, lambda: load(parquet_path)),
+        measure("parquet (dashboard columns)", parquet_path,
+                lambda: load(parquet_path, DASHBOARD_COLUMNS)),
+    ]
+
+
+def main():
+    from hub.storage import open_store
+
+    parser = argparse.ArgumentParser(description="Columnar (Parquet) complaint archives")
+    sub = parser.add_subparsers(dest="command", required=True)
+    to_parquet = sub.add_parser("to-parquet", help="Convert a complaints CSV to Parquet")
+    to_parquet.add_argument("csv_path")
+    to_parquet.add_argument("parquet_path")
+    from_store = sub.add_parser("export", help="Write the complaint store to Parquet")
+    from_store.add_argument("parquet_path")
+    from_store.add_argument("--db", default="complaints.db")
+    to_csv = sub.add_parser("to-csv", help="Convert a Parquet archive back to CSV")
+    to_csv.add_argument("parquet_path")
+    to_csv.add_argument("csv_path")
+    bench = sub.add_parser("compare", help="Compare size, load time and memory")
+    bench.add_argument("csv_path")
+    bench.add_argument("parquet_path")
+    args = parser.parse_args()
+
+    if args.command == "to-parquet":
+        print(f"Wrote {csv_to_parquet(args.csv_path, args.parquet_path)} rows to {args.parquet_path}")
+    elif args.command == "export":
+        rows = store_to_parquet(open_store(args.db), args.parquet_path)
+        print(f"Wrote {rows} rows to {args.parquet_path}")
+    elif args.command == "to-csv":
+        parquet_to_csv(args.parquet_path, args.csv_path)
+        print(f"Wrote {args.csv_path}")
+    else:
+        for result in compare(args.csv_path, args.parquet_path):
+            print(f"{result['format']:<28} file {result['file_bytes'] / 1e6:8.2f} MB  "
+                  f"load {result['load_seconds']:7.3f}s  memory {result['memory_bytes'] / 1e6:8.2f} MB")
+
+
+if __name__ == "__main__":
+    main()
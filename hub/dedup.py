@@ -0,0 +1,148 @@
+import hashlib
+import operator
+import re
+import struct
+import threading
+import time
+from collections import Counter, OrderedDict
+
+from hub import metrics
+from hub.ids import first_id_at, id_timestamp
+
+# --- MinHash / LSH near-duplicate detection ---
+# Descriptions become sets of character 4-grams ("shingles"), so the same
+# sentence with a typo, extra word or different punctuation still overlaps.
+# Each blake2b digest yields 16 32-bit hashes; three salts give a signature of
+# 48 min-hashes, banded 16 x 3 so pairs above ~0.4 Jaccard usually collide.
+SHINGLE = 4
+SALTS = [bytes([n]) * 16 for n in range(3)]
+NUM_HASHES = 16 * len(SALTS)
+BANDS = 16
+ROWS = NUM_HASHES // BANDS
+# Keep at most this many complaints per LSH bucket (the newest win)
+MAX_BUCKET = 64
+# Only the candidates sharing the most bands get a full signature comparison
+MAX_CANDIDATES = 8
+
+_WORDS = re.compile(r"\w+")
+_UNPACK = struct.Struct("<16I").unpack
+
+
+def shingles(text):
+    normalized = " ".join(_WORDS.findall(text.lower()))
+    if len(normalized) <= SHINGLE:
+        return {normalized}
+    return {normalized[i:i + SHINGLE] for i in range(len(normalized) - SHINGLE + 1)}
+
+
+def signature(text):
+    rows = [
+        sum((_UNPACK(hashlib.blake2b(shingle.encode("utf-8"), digest_size=64, salt=salt).digest())
+             for salt in SALTS), ())
+        for shingle in shingles(text)
+    ]
+    return tuple(map(min, zip(*rows)))
+
+
+def similarity(left, right):
+    """Estimated Jaccard similarity of the two shingle sets."""
+    return sum(map(operator.eq, left, right)) / NUM_HASHES
+
+
+class DuplicateIndex:
+    """In-memory LSH index of recent complaints, one namespace per Department.
+
+    ``check`` compares a new description with the complaints already in its
+    department's buckets, so the cost depends on how many complaints share
+    a bucket rather than on how many are indexed. Complaints older than
+    ``window`` seconds (by tracking ID) or beyond ``max_entries`` are
+    evicted.
+    """
+
+    def __init__(self, threshold=0.6, window=3 * 86400, max_entries=20000):
+        self.threshold = threshold
+        self.window = window
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        # complaint ID -> (bucket keys, signature, cluster parent), oldest first
+        self._entries = OrderedDict()
+        self._buckets = {}
+        self.stats = {"checks": 0, "matches": 0, "evicted": 0}
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def _bucket_keys(department, sig):
+        return [(department, band, sig[band * ROWS:(band + 1) * ROWS]) for band in range(BANDS)]
+
+    def _add(self, complaint_id, keys, sig, parent):
+        self._entries[complaint_id] = (keys, sig, parent)
+        for key in keys:
+            bucket = self._buckets.setdefault(key, [])
+            bucket.append(complaint_id)
+            if len(bucket) > MAX_BUCKET:
+                del bucket[0]
+
+    def _remove_oldest(self):
+        complaint_id, (keys, _, _) = self._entries.popitem(last=False)
+        for key in keys:
+            bucket = self._buckets.get(key)
+            if bucket and complaint_id in bucket:
+                bucket.remove(complaint_id)
+                if not bucket:
+                    del self._buckets[key]
+        self.stats["evicted"] += 1
+
+    def evict(self, now=None):
+        cutoff = (time.time() if now is None else now) - self.window
+        while self._entries and (
+            len(self._entries) > self.max_entries
+            or id_timestamp(next(iter(self._entries))) < cutoff
+        ):
+            self._remove_oldest()
+
+    def _best_match(self, keys, sig):
+        best, best_score = None, self.threshold
+        votes = Counter()
+        for key in keys:
+            votes.update(self._buckets.get(key, ()))
+        for candidate, _ in votes.most_common(MAX_CANDIDATES):
+            score = similarity(sig, self._entries[candidate][1])
+            if score >= best_score:
+                best, best_score = candidate, score
+        return best, best_score
+
+    def add(self, complaint_id, department, text, parent=None):
+        sig = signature(text)
+        with self._lock:
+            self._add(complaint_id, self._bucket_keys(department or "", sig), sig, parent)
+            self.evict()
+
+    @metrics.timed("nlp_seconds", op="dedup")
+    def check(self, complaint_id, department, text):
+        """Index a new complaint; returns (cluster parent, similarity) or None."""
+        sig = signature(text)
+        keys = self._bucket_keys(department or "", sig)
+        with self._lock:
+            self.evict()
+            self.stats["checks"] += 1
+            best, score = self._best_match(keys, sig)
+            parent = None
+            if best is not None:
+                parent = self._entries[best][2] or best
+                self.stats["matches"] += 1
+            self._add(complaint_id, keys, sig, parent)
+            if len(self._entries) > self.max_entries:
+                self._remove_oldest()
+        return (parent, score) if parent is not None else None
+
+    def warm(self, store):
+        """Index the complaints still inside the window, with their clusters."""
+        low = first_id_at(time.time() - self.window)
+        rows, _ = store.query(id_range=(low, None), sort_by="ID", descending=True,
+                              limit=self.max_entries)
+        parents = store.cluster_links(low)
+        for row in reversed(rows):
+            self.add(row["ID"], row["Department"], row["Description"] or "", parents.get(row["ID"]))
+        return len(rows)
@@ -0,0 +1,31 @@
+# --- Helper Functions ---
+def create_status_badge(status, priority=None):
+    if status == "Pending":
+        return f'<span class="status-pending">{status}</span>'
+    elif status == "In Progress":
+        return f'<span class="status-progress">{status}</span>'
+    elif status == "Resolved":
+        return f'<span class="status-resolved">{status}</span>'
+    elif priority == "High":
+        return f'<span class="status-high">{priority}</span>'
+    elif priority == "Medium":
+        return f'<span class="status-medium">{priority}</span>'
+    elif priority == "Low":
+        return f'<span class="status-low">{priority}</span>'
+    return status
+
+# --- Department mapping ---
+department_mapping = {
+    "Electricity": "QESCO", 
+    "Water": "Water Board", 
+    "Health": "Health Dept", 
+    "Roads": "Public Works", 
+    "Sanitation": "Municipal",
+    "Other": "General Affairs"
+}
+
+# --- Urdu category names ---
+category_translation = {
+    "بجلی": "Electricity", "پانی": "Water", "صحت": "Health",
+    "سڑکیں": "Roads", "صفائی": "Sanitation", "دیگر": "Other"
+}
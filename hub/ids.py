@@ -0,0 +1,126 @@
+import argparse
+import os
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows: fall back to pid-derived worker IDs
+    fcntl = None
+
+# --- ID layout: | milliseconds since EPOCH | worker (4 bits) | sequence (8 bits) | ---
+EPOCH_MS = 1704067200000  # 2024-01-01 UTC
+WORKER_BITS = 4
+SEQUENCE_BITS = 8
+MAX_WORKERS = 1 << WORKER_BITS
+MAX_SEQUENCE = (1 << SEQUENCE_BITS) - 1
+
+# Legacy IDs were int(timestamp()) in seconds; anything below this is one of those.
+LEGACY_ID_LIMIT = 10 ** 11
+
+
+def _claim_worker_id(lock_dir):
+    """Hold an exclusive lock on one worker slot for the life of the process."""
+    if fcntl is None:
+        return os.getpid() % MAX_WORKERS, None
+    os.makedirs(lock_dir, exist_ok=True)
+    for worker_id in range(MAX_WORKERS):
+        handle = open(os.path.join(lock_dir, f"worker-{worker_id}.lock"), "a")
+        try:
+            fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            handle.close()
+            continue
+        return worker_id, handle
+    raise RuntimeError(f"All {MAX_WORKERS} ID worker slots in {lock_dir} are in use")
+
+
+class IdGenerator:
+    """Snowflake-style tracking IDs: time-ordered and unique per host.
+
+    Each process claims a worker slot, and within a process a short lock
+    guards the (millisecond, sequence) pair. If the sequence for the current
+    millisecond is exhausted, the generator borrows the next millisecond
+    instead of sleeping, so IDs stay strictly increasing.
+    """
+
+    def __init__(self, lock_dir=".ids", worker_id=None):
+        if worker_id is None:
+            worker_id, self._lock_handle = _claim_worker_id(lock_dir)
+        else:
+            self._lock_handle = None
+        if not 0 <= worker_id < MAX_WORKERS:
+            raise ValueError(f"worker_id must be in [0, {MAX_WORKERS})")
+        self.worker_id = worker_id
+        self._lock = threading.Lock()
+        self._last_ms = 0
+        self._sequence = 0
+
+    def next_id(self):
+        now_ms = int(time.time() * 1000) - EPOCH_MS
+        with self._lock:
+            if now_ms > self._last_ms:
+                self._last_ms = now_ms
+                self._sequence = 0
+            elif self._sequence < MAX_SEQUENCE:
+                self._sequence += 1
+            else:
+                self._last_ms += 1
+                self._sequence = 0
+            ms, sequence = self._last_ms, self._sequence
+        return (ms << (WORKER_BITS + SEQUENCE_BITS)) | (self.worker_id << SEQUENCE_BITS) | sequence
+
+
+def id_timestamp(complaint_id):
+    """Unix timestamp (seconds) encoded in a tracking ID, legacy or new."""
+    complaint_id = int(complaint_id)
+    if complaint_id < LEGACY_ID_LIMIT:
+        return float(complaint_id)
+    return ((complaint_id >> (WORKER_BITS + SEQUENCE_BITS)) + EPOCH_MS) / 1000
+
+
+def first_id_at(timestamp):
+    """Smallest new-style tracking ID issued at or after ``timestamp``."""
+    return max(int(timestamp * 1000) - EPOCH_MS, 0) << (WORKER_BITS + SEQUENCE_BITS)
+
+
+def id_month(complaint_id):
+    """UTC "YYYY-MM" a tracking ID was issued in; the store's partition key."""
+    return time.strftime("%Y-%m", time.gmtime(id_timestamp(complaint_id)))
+
+
+def benchmark(total=200000, threads=8):
+    generator = IdGenerator(worker_id=0)
+    per_thread = total // threads
+    results = [None] * threads
+
+    def work(slot):
+        results[slot] = [generator.next_id() for _ in range(per_thread)]
+
+    workers = [threading.Thread(target=work, args=(i,)) for i in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+
+    ids = [i for chunk in results for i in chunk]
+    assert len(set(ids)) == len(ids), "duplicate IDs generated"
+    assert all(chunk == sorted(chunk) for chunk in results), "IDs not monotonic"
+    return {"ids": len(ids), "threads": threads, "seconds": elapsed,
+            "ids_per_sec": len(ids) / elapsed}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tracking ID generator benchmark")
+    parser.add_argument("--total", type=int, default=200000)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+    result = benchmark(args.total, args.threads)
+    print(f"{result['ids']} unique IDs on {result['threads']} threads in "
+          f"{result['seconds']:.3f}s ({result['ids_per_sec']:,.0f} IDs/sec)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+import bisect
+import functools
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# --- In-process metrics registry (Prometheus text format) ---
+LATENCY_BUCKETS = [0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10]
+
+_lock = threading.Lock()
+_counters = {}
+_histograms = {}
+_help = {}
+
+
+def _key(name, labels):
+    return name, tuple(sorted(labels.items()))
+
+
+def describe(name, help_text):
+    _help[name] = help_text
+
+
+def inc(name, value=1, **labels):
+    key = _key(name, labels)
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + value
+
+
+def _observe(key, value):
+    with _lock:
+        histogram = _histograms.get(key)
+        if histogram is None:
+            histogram = _histograms[key] = [[0] * (len(LATENCY_BUCKETS) + 1), 0.0, 0]
+        histogram[0][bisect.bisect_left(LATENCY_BUCKETS, value)] += 1
+        histogram[1] += value
+        histogram[2] += 1
+
+
+def observe(name, value, **labels):
+    _observe(_key(name, labels), value)
+
+
+class timer:
+    """Context manager that records its duration in a latency histogram."""
+
+    __slots__ = ("key", "start")
+
+    def __init__(self, name, **labels):
+        self.key = _key(name, labels)
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        _observe(self.key, time.perf_counter() - self.start)
+
+
+def timed(name, **labels):
+    """Decorator form of ``timer``."""
+    key = _key(name, labels)
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                _observe(key, time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+
+def payload_bytes(rows):
+    """Approximate size of complaint rows: text length plus 8 bytes per number."""
+    return sum(
+        len(value) if isinstance(value, str) else 8
+        for row in rows for value in row.values() if value is not None
+    )
+
+
+# --- Export ---
+def snapshot():
+    with _lock:
+        counters = dict(_counters)
+        histograms = {key: (list(h[0]), h[1], h[2]) for key, h in _histograms.items()}
+    return counters, histograms
+
+
+def quantile(buckets, q):
+    """Upper bound of the bucket holding quantile ``q`` of a histogram."""
+    total = sum(buckets)
+    if not total:
+        return 0.0
+    seen = 0
+    for bound, count in zip(LATENCY_BUCKETS + [float("inf")], buckets):
+        seen += count
+        if seen >= q * total:
+            return bound
+    return float("inf")
+
+
+def _labels(labels, extra=()):
+    pairs = list(labels) + list(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{v}"' for k, v in pairs) + "}"
+
+
+def render_prometheus():
+    counters, histograms = snapshot()
+    lines = []
+    for name in sorted({name for name, _ in counters}):
+        if name in _help:
+            lines.append(f"# HELP {name} {_help[name]}")
+        lines.append(f"# TYPE {name} counter")
+        for (key_name, labels), value in sorted(counters.items()):
+            if key_name == name:
+                lines.append(f"{name}{_labels(labels)} {value}")
+    for name in sorted({name for name, _ in histograms}):
+        if name in _help:
+            lines.append(f"# HELP {name} {_help[name]}")
+        lines.append(f"# TYPE {name} histogram")
+        for (key_name, labels), (buckets, total, count) in sorted(histograms.items()):
+            if key_name != name:
+                continue
+            cumulative = 0
+            for bound, bucket in zip(LATENCY_BUCKETS + ["+Inf"], buckets):
+                cumulative += bucket
+                lines.append(f"{name}_bucket{_labels(labels, [('le', bound)])} {cumulative}")
+            lines.append(f"{name}_sum{_labels(labels)} {total}")
+            lines.append(f"{name}_count{_labels(labels)} {count}")
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus(path):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        f.write(render_prometheus())
+    os.replace(tmp_path, path)
+
+
+def start_file_exporter(path, interval=15):
+    """Rewrite ``path`` every ``interval`` seconds (node_exporter textfile style)."""
+    def loop():
+        while True:
+            time.sleep(interval)
+            write_prometheus(path)
+
+    threading.Thread(target=loop, name="metrics-file", daemon=True).start()
+
+
+def start_http_server(port, host="127.0.0.1"):
+    """Serve /metrics on a side port; Streamlit has no custom routes."""
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path != "/metrics":
+                self.send_error(404)
+                return
+            body = render_prometheus().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    return server
+
+
+describe("page_reruns_total", "Script reruns per page")
+describe("page_render_seconds", "Time to render each page")
+describe("storage_op_seconds", "Complaint store operation latency")
+describe("storage_bytes_read_total", "Approximate complaint payload bytes read from the store")
+describe("storage_bytes_written_total", "Approximate complaint payload bytes written to the store")
+describe("partitions_pruned_total", "Month partitions skipped by store queries using the catalog")
+describe("nlp_seconds", "Sentiment, priority and duplicate detection latency")
+describe("sentiment_scored_total", "Descriptions scored by TextBlob (LRU misses)")
+describe("figure_build_seconds", "Plotly figure construction time")
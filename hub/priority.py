@@ -0,0 +1,159 @@
+import argparse
+import json
+import re
+
+from hub import metrics
+
+# --- Default keyword rules: (priority, weight, keywords) ---
+# A trailing "*" matches any word starting with the stem ("delay*" -> "delayed").
+DEFAULT_RULES = [
+    ("High", 3, [
+        "urgent*", "immediate*", "danger*", "fire*", "flood*", "emergency",
+        "فوری", "فوراً", "خطرہ", "خطرناک", "آگ", "سیلاب", "ایمرجنسی"
+    ]),
+    ("Medium", 1, [
+        "delay*", "broken", "issue*", "problem*",
+        "تاخیر", "ٹوٹا", "ٹوٹی", "ٹوٹے", "خراب", "مسئلہ", "مسائل"
+    ]),
+]
+# Minimum score for each level, checked in order; anything below is "Low".
+DEFAULT_THRESHOLDS = [("High", 3), ("Medium", 1)]
+# How match weights become a score: "max" (the strongest keyword decides, so
+# any High keyword gives High and Medium keywords never add up to it) or "sum".
+DEFAULT_COMBINE = "max"
+COMBINERS = {"max": lambda weights: max(weights, default=0), "sum": sum}
+
+
+class PriorityClassifier:
+    """Keyword priority rules compiled into one word-bounded regex.
+
+    Every keyword of every level is matched in a single pass over the text;
+    the weights of all matches are combined (see DEFAULT_COMBINE) and the
+    first level whose threshold is reached wins.
+    """
+
+    def __init__(self, rules=DEFAULT_RULES, thresholds=DEFAULT_THRESHOLDS, default="Low",
+                 combine=DEFAULT_COMBINE):
+        if combine not in COMBINERS:
+            raise ValueError(f"Unknown combine mode: {combine}")
+        self.thresholds = list(thresholds)
+        self.default = default
+        self.combine = combine
+        self._exact = {}
+        self._stems = []
+        alternatives = []
+        for _, weight, keywords in rules:
+            for keyword in keywords:
+                keyword = keyword.lower()
+                if keyword.endswith("*"):
+                    stem = keyword[:-1]
+                    self._stems.append((stem, weight))
+                    alternatives.append(re.escape(stem) + r"\w*")
+                else:
+                    self._exact[keyword] = weight
+                    alternatives.append(re.escape(keyword))
+        # Longest first so a keyword is never shadowed by one of its prefixes
+        alternatives.sort(key=len, reverse=True)
+        self.pattern = re.compile(
+            r"(?<!\w)(" + "|".join(alternatives) + r")(?!\w)", re.IGNORECASE
+        )
+
+    @classmethod
+    def from_json(cls, path):
+        with open(path, encoding="utf-8") as f:
+            config = json.load(f)
+        return cls(
+            rules=[(r["priority"], r["weight"], r["keywords"]) for r in config["rules"]],
+            thresholds=[tuple(t) for t in config.get("thresholds", DEFAULT_THRESHOLDS)],
+            default=config.get("default", "Low"),
+            combine=config.get("combine", DEFAULT_COMBINE)
+        )
+
+    def weight(self, token):
+        token = token.lower()
+        if token in self._exact:
+            return self._exact[token]
+        return max((w for stem, w in self._stems if token.startswith(stem)), default=0)
+
+    def level(self, score):
+        for priority, minimum in self.thresholds:
+            if score >= minimum:
+                return priority
+        return self.default
+
+    def classify(self, text_input):
+        weights = [self.weight(m) for m in self.pattern.findall(text_input or "")]
+        return self.level(COMBINERS[self.combine](weights))
+
+    def classify_many(self, texts):
+        """Classify an iterable of text; repeated texts are only matched once.
+
+        Bulk imports and re-runs are full of identical descriptions, and
+        classifying each distinct text once is where the time goes; the
+        regex pass itself is already a single scan per text.
+        """
+        levels = {}
+        result = []
+        for text in texts:
+            text = text if isinstance(text, str) else ""
+            level = levels.get(text)
+            if level is None:
+                level = levels[text] = self.classify(text)
+            result.append(level)
+        return result
+
+
+default_classifier = PriorityClassifier()
+
+
+@metrics.timed("nlp_seconds", op="priority")
+def detect_priority(text_input):
+    return default_classifier.classify(text_input)
+
+
+def reclassify_store(store, classifier=default_classifier, chunk_size=100000):
+    """Re-run the rules over every complaint, archived ones too; returns how many changed."""
+    changed = 0
+    chunk = []
+
+    def flush():
+        nonlocal changed
+        levels = classifier.classify_many([row["Description"] for row in chunk])
+        ops = [
+            ("priority", (row["ID"], level))
+            for row, level in zip(chunk, levels) if level != row["Priority"]
+        ]
+        store.write_batch(ops)
+        changed += len(ops)
+
+    for row in store.iter_rows():
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            flush()
+            chunk = []
+    if chunk:
+        flush()
+    # Compacted months are rewritten one archive at a time
+    for month in store.archived_months():
+        rows = [row for rows in store.iter_archived(month) for row in rows]
+        levels = classifier.classify_many([row["Description"] for row in rows])
+        changed += store.update_archived(month, "Priority", {
+            row["ID"]: level for row, level in zip(rows, levels)
+        })
+    return changed
+
+
+def main():
+    from hub.storage import open_store
+
+    parser = argparse.ArgumentParser(description="Re-prioritize stored complaints")
+    parser.add_argument("--db", default="complaints.db")
+    parser.add_argument("--rules", help="JSON file with custom priority rules")
+    args = parser.parse_args()
+
+    classifier = PriorityClassifier.from_json(args.rules) if args.rules else default_classifier
+    print(f"Changed priority of {reclassify_store(open_store(args.db), classifier)} complaints")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+import importlib
+import os
+import sys
+import threading
+import time
+
+# Set HUB_PROFILE=1 to show import and rerun timings in the sidebar
+ENABLED = os.environ.get("HUB_PROFILE", "") not in ("", "0")
+
+_lock = threading.Lock()
+import_times = {}
+rerun_times = {}
+
+
+def import_module(name):
+    """Import ``name``, recording how long the first (cold) import took."""
+    if name in sys.modules:
+        return sys.modules[name]
+    start = time.perf_counter()
+    module = importlib.import_module(name)
+    with _lock:
+        import_times.setdefault(name, time.perf_counter() - start)
+    return module
+
+
+def record_rerun(page, seconds):
+    with _lock:
+        stats = rerun_times.setdefault(page, {"runs": 0, "total": 0.0, "last": 0.0, "max": 0.0})
+        stats["runs"] += 1
+        stats["total"] += seconds
+        stats["last"] = seconds
+        stats["max"] = max(stats["max"], seconds)
+
+
+def report():
+    with _lock:
+        lines = [f"cold import {name}: {seconds * 1000:.1f} ms"
+                 for name, seconds in sorted(import_times.items())]
+        lines += [
+            f"{page}: {s['runs']} reruns, last {s['last'] * 1000:.1f} ms, "
+            f"avg {s['total'] / s['runs'] * 1000:.1f} ms, max {s['max'] * 1000:.1f} ms"
+            for page, s in sorted(rerun_times.items())
+        ]
+    return lines
@@ -0,0 +1,71 @@
+import os
+
+import streamlit as st
+
+from hub import metrics
+
+from hub.ids import IdGenerator
+from hub.sentiment import SentimentScorer
+from hub.storage import migrate_csv, open_store
+from hub.uploads import UploadStore
+from hub.writer import GroupCommitWriter
+
+# --- Complaint storage ---
+DATA_FILE = "complaints.csv"  # legacy file, imported once into the store
+DB_FILE = "complaints.db"
+UPLOAD_DIR = "uploads"
+METRICS_FILE = os.environ.get("HUB_METRICS_FILE")  # e.g. metrics.prom for a textfile collector
+METRICS_PORT = os.environ.get("HUB_METRICS_PORT")  # e.g. 9108 to serve /metrics
+
+# --- Process-wide resources shared by every session ---
+@st.cache_resource
+def get_store():
+    store = open_store(DB_FILE)
+    migrate_csv(store, DATA_FILE)
+    return store
+
+@st.cache_resource
+def get_writer():
+    return GroupCommitWriter(get_store(), flush_interval=0.005, max_batch=500)
+
+@st.cache_resource
+def get_id_generator():
+    return IdGenerator(lock_dir=".ids")
+
+@st.cache_resource
+def get_sentiment_scorer():
+    scorer = SentimentScorer(get_writer(), processes=2)
+    scorer.recover(get_store())
+    return scorer
+
+@st.cache_resource
+def get_upload_store():
+    return UploadStore(UPLOAD_DIR)
+
+@st.cache_resource
+def get_figure_cache():
+    from hub.charts import FigureCache
+
+    return FigureCache()
+
+@st.cache_resource
+def start_metrics_exporters():
+    if METRICS_FILE:
+        metrics.start_file_exporter(METRICS_FILE)
+    if METRICS_PORT:
+        metrics.start_http_server(int(METRICS_PORT))
+    return True
+
+@st.cache_resource
+def get_duplicate_index():
+    from hub.dedup import DuplicateIndex
+
+    index = DuplicateIndex()
+    index.warm(get_store())
+    return index
+
+@st.cache_resource
+def get_assistant():
+    from hub.assistant import Assistant
+
+    return Assistant()
@@ -0,0 +1,63 @@
+import re
+
+# --- Full-text index over complaint text (SQLite FTS5, kept in the store file) ---
+FTS_COLUMNS = ["Name", "Department", "Description"]
+# unicode61 splits on Unicode separators/punctuation, so Urdu words (and the
+# Urdu full stop "۔") tokenize the same way English ones do.
+TOKENIZER = "unicode61 remove_diacritics 2"
+
+_TERMS = re.compile(r'"([^"]+)"|(\S+)')
+
+
+def create_index(conn):
+    """Create the FTS table and triggers; returns True if it was just created."""
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE name = 'complaints_fts'"
+    ).fetchone()
+    columns = ", ".join(FTS_COLUMNS)
+    new_columns = ", ".join(f"new.{col}" for col in FTS_COLUMNS)
+    old_columns = ", ".join(f"old.{col}" for col in FTS_COLUMNS)
+    conn.execute(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS complaints_fts USING fts5("
+        f"{columns}, content='complaints', content_rowid='seq', tokenize='{TOKENIZER}')"
+    )
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS complaints_fts_insert AFTER INSERT ON complaints BEGIN
+            INSERT INTO complaints_fts (rowid, {columns}) VALUES (new.seq, {new_columns});
+        END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS complaints_fts_update
+        AFTER UPDATE OF {columns} ON complaints BEGIN
+            INSERT INTO complaints_fts (complaints_fts, rowid, {columns})
+                VALUES ('delete', old.seq, {old_columns});
+            INSERT INTO complaints_fts (rowid, {columns}) VALUES (new.seq, {new_columns});
+        END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS complaints_fts_delete AFTER DELETE ON complaints BEGIN
+            INSERT INTO complaints_fts (complaints_fts, rowid, {columns})
+                VALUES ('delete', old.seq, {old_columns});
+        END
+    """)
+    if not exists:
+        conn.execute("INSERT INTO complaints_fts (complaints_fts) VALUES ('rebuild')")
+    return not exists
+
+
+def to_match(query):
+    """Turn user input into a safe FTS5 expression.
+
+    Quoted text is a phrase, a trailing * makes a prefix term, and all
+    parts must match. Everything else is quoted so FTS syntax characters
+    in user input cannot cause errors.
+    """
+    parts = []
+    for phrase, word in _TERMS.findall(query):
+        if phrase:
+            parts.append('"' + phrase.replace('"', "") + '"')
+        elif word.endswith("*") and len(word) > 1:
+            parts.append('"' + word[:-1].replace('"', "") + '"*')
+        elif word.strip('"'):
+            parts.append('"' + word.replace('"', "") + '"')
+    return " ".join(parts)
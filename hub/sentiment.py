@@ -0,0 +1,228 @@
+import argparse
+import hashlib
+import logging
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+from hub import metrics
+
+PENDING = "Pending"
+
+log = logging.getLogger(__name__)
+
+
+def _label(text_input):
+    from textblob import TextBlob
+
+    polarity = TextBlob(text_input).sentiment.polarity
+    if polarity < -0.2: return "Negative"
+    elif polarity > 0.2: return "Positive"
+    else: return "Neutral"
+
+
+def label_many(texts):
+    return [_label(text_input) for text_input in texts]
+
+
+class LabelCache:
+    """Bounded LRU of sentiment labels keyed by a hash of the description."""
+
+    def __init__(self, maxsize=10000):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._labels = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0}
+
+    @staticmethod
+    def key(text_input):
+        return hashlib.blake2b(text_input.encode("utf-8"), digest_size=16).digest()
+
+    def get(self, key):
+        with self._lock:
+            label = self._labels.get(key)
+            if label is None:
+                self.stats["misses"] += 1
+                return None
+            self._labels.move_to_end(key)
+            self.stats["hits"] += 1
+            return label
+
+    def put(self, key, label):
+        with self._lock:
+            self._labels[key] = label
+            self._labels.move_to_end(key)
+            if len(self._labels) > self.maxsize:
+                self._labels.popitem(last=False)
+
+
+_cache = LabelCache()
+
+
+def _new_pool(processes):
+    return ProcessPoolExecutor(max_workers=processes, mp_context=get_context("spawn"))
+
+
+@metrics.timed("nlp_seconds", op="sentiment_batch")
+def score_many(texts, pool=None, cache=_cache, chunksize=64):
+    """Labels for ``texts``; cache misses are scored on ``pool`` when given."""
+    keys = [cache.key(text_input) for text_input in texts]
+    labels = [cache.get(key) for key in keys]
+    missing = [i for i, label in enumerate(labels) if label is None]
+    if missing:
+        missing_texts = [texts[i] for i in missing]
+        metrics.inc("sentiment_scored_total", len(missing_texts))
+        if pool is None:
+            scored = label_many(missing_texts)
+        else:
+            chunks = [missing_texts[i:i + chunksize] for i in range(0, len(missing_texts), chunksize)]
+            scored = [label for chunk in pool.map(label_many, chunks) for label in chunk]
+        for i, label in zip(missing, scored):
+            labels[i] = label
+            cache.put(keys[i], label)
+    return labels
+
+
+def get_sentiment(text_input):
+    return score_many([text_input])[0]
+
+
+class SentimentScorer:
+    """Scores complaints in the background and writes the labels back.
+
+    Complaints are stored with a Pending sentiment; ``submit`` queues them
+    and a daemon thread scores whatever is queued in batches (on a process
+    pool when ``processes`` > 0) and hands the results to the writer.
+    """
+
+    def __init__(self, writer, processes=0, batch_size=64, flush_interval=0.2):
+        self.writer = writer
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._pool = _new_pool(processes) if processes else None
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="sentiment-scorer", daemon=True)
+        self._thread.start()
+
+    def submit(self, complaint_id, description):
+        self._queue.put((complaint_id, description or ""))
+
+    def recover(self, store, page_size=10000):
+        """Queue every complaint left Pending by a previous process."""
+        queued = 0
+        after = None
+        while True:
+            rows, _ = store.query(
+                filters={"Sentiment": [PENDING]}, id_range=(after, None),
+                descending=False, limit=page_size
+            )
+            for row in rows:
+                self.submit(row["ID"], row["Description"])
+            queued += len(rows)
+            if len(rows) < page_size:
+                return queued
+            after = rows[-1]["ID"] + 1
+
+    def _next_batch(self):
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=timeout))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            self._process(self._next_batch())
+
+    def _process(self, batch):
+        try:
+            labels = score_many([description for _, description in batch], self._pool)
+        except Exception:
+            # Leave the rows Pending so recover() retries them on the next start
+            log.exception("Sentiment scoring failed for %d complaints", len(batch))
+            return
+        for (complaint_id, _), label in zip(batch, labels):
+            self.writer.update_sentiment(complaint_id, label)
+
+
+def rescore_all(store, processes=None, batch_size=20000):
+    """Re-score every stored complaint, compacted months included, across cores."""
+    processes = processes or os.cpu_count() or 1
+    chunksize = max(64, batch_size // (processes * 4))
+    rescored = 0
+    batch = []
+    with _new_pool(processes) as pool:
+        for row in store.iter_rows():
+            batch.append(row)
+            if len(batch) >= batch_size:
+                rescored += _rescore_batch(store, batch, pool, chunksize)
+                batch = []
+        rescored += _rescore_batch(store, batch, pool, chunksize)
+        # Compacted months are rewritten one archive at a time
+        for month in store.archived_months():
+            rows = [row for rows in store.iter_archived(month) for row in rows]
+            labels = score_many([row["Description"] or "" for row in rows], pool, chunksize=chunksize)
+            store.update_archived(month, "Sentiment", {
+                row["ID"]: label for row, label in zip(rows, labels)
+            })
+            rescored += len(rows)
+    return rescored
+
+
+def score_pending(store, processes=None, page_size=20000):
+    """Score the complaints still Pending, e.g. after ``bulk import --skip-sentiment``."""
+    processes = processes or os.cpu_count() or 1
+    chunksize = max(64, page_size // (processes * 4))
+    scored = 0
+    after = None
+    with _new_pool(processes) as pool:
+        while True:
+            rows, _ = store.query(
+                filters={"Sentiment": [PENDING]}, id_range=(after, None),
+                descending=False, limit=page_size
+            )
+            scored += _rescore_batch(store, rows, pool, chunksize)
+            if len(rows) < page_size:
+                return scored
+            after = rows[-1]["ID"] + 1
+
+
+def _rescore_batch(store, rows, pool, chunksize):
+    if not rows:
+        return 0
+    labels = score_many([row["Description"] or "" for row in rows], pool, chunksize=chunksize)
+    store.write_batch([
+        ("sentiment", (row["ID"], label))
+        for row, label in zip(rows, labels) if label != row["Sentiment"]
+    ])
+    return len(rows)
+
+
+def main():
+    from hub.storage import open_store
+
+    parser = argparse.ArgumentParser(description="Bulk sentiment re-scoring")
+    parser.add_argument("--db", default="complaints.db")
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--pending", action="store_true",
+                        help="Only score complaints whose sentiment is still Pending")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    rescore = score_pending if args.pending else rescore_all
+    rescored = rescore(open_store(args.db), args.processes)
+    print(f"Scored {rescored} complaints in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,17 @@
+# --- Complaint lifecycle ---
+PENDING = "Pending"
+IN_PROGRESS = "In Progress"
+RESOLVED = "Resolved"
+STATUSES = [PENDING, IN_PROGRESS, RESOLVED]
+
+# new status -> statuses a complaint may move to it from
+TRANSITIONS = {
+    IN_PROGRESS: [PENDING],
+    RESOLVED: [PENDING, IN_PROGRESS],
+}
+
+
+def allowed_from(status):
+    if status not in TRANSITIONS:
+        raise ValueError(f"Cannot move complaints to status {status!r}")
+    return TRANSITIONS[status]
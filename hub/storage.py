@@ -0,0 +1,908 @@
+import argparse
+import csv
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+from hub import aggregates, metrics, search, status as lifecycle
+from hub.ids import id_month
+
+# --- Complaint schema ---
+COLUMNS = [
+    "ID", "Name", "Category", "Department", "Priority",
+    "Status", "Description", "Sentiment", "Image"
+]
+FILTER_COLUMNS = ["Status", "Priority", "Department", "Category", "Sentiment"]
+SORT_COLUMNS = ["ID"] + FILTER_COLUMNS
+# write_batch op name -> column it updates ("status" also goes through the lifecycle)
+UPDATE_OPS = {"sentiment": "Sentiment", "priority": "Priority"}
+# SQLite bound-parameter budget per statement when expanding ID lists
+ID_CHUNK = 500
+# Compacted months are written here, next to the database file
+ARCHIVE_DIR = "archive"
+
+
+class ComplaintStore:
+    """Interface every storage backend implements."""
+
+    def append(self, record):
+        self.append_many([record])
+
+    def append_many(self, records):
+        raise NotImplementedError
+
+    def import_batches(self, batches, meta=None):
+        raise NotImplementedError
+
+    def iter_rows(self, include_archived=False):
+        raise NotImplementedError
+
+    def load(self):
+        return list(self.iter_rows())
+
+    def load_since(self, after_seq, limit=None):
+        raise NotImplementedError
+
+    def get(self, complaint_id):
+        raise NotImplementedError
+
+    def query(self, filters=None, id_range=None, sort_by="ID", descending=True,
+              limit=50, offset=0, preview_chars=None, months=None):
+        raise NotImplementedError
+
+    def version(self):
+        raise NotImplementedError
+
+    def update_status(self, complaint_id, status):
+        raise NotImplementedError
+
+    def write_batch(self, ops, isolate=False):
+        """Apply ("insert", record), ("status", (id, status)),
+        ("duplicate", (id, parent id)) and (op in UPDATE_OPS, (id, value))
+        ops in one commit.
+
+        With ``isolate`` an op that raises is rolled back on its own and its
+        exception is returned in its result slot; otherwise it aborts the
+        whole batch."""
+        raise NotImplementedError
+
+    def bulk_transition(self, status, ids=None, id_range=None, filters=None, months=None):
+        raise NotImplementedError
+
+    def status_history(self, complaint_id):
+        raise NotImplementedError
+
+    def clusters(self, months=None, departments=None, limit=20):
+        raise NotImplementedError
+
+    def cluster_members(self, parent_id):
+        raise NotImplementedError
+
+    def cluster_links(self, since_id=0):
+        raise NotImplementedError
+
+    def search(self, text, filters=None, id_range=None, limit=50, offset=0, months=None):
+        raise NotImplementedError
+
+    def count(self):
+        raise NotImplementedError
+
+    def image_references(self):
+        raise NotImplementedError
+
+    def aggregates(self, months=None, departments=None):
+        raise NotImplementedError
+
+    def partitions(self):
+        raise NotImplementedError
+
+    def compact(self, month):
+        raise NotImplementedError
+
+    def archived_months(self):
+        raise NotImplementedError
+
+    def iter_archived(self, month=None, batch_size=50000):
+        raise NotImplementedError
+
+    def update_archived(self, month, column, values):
+        raise NotImplementedError
+
+    def verify_aggregates(self):
+        raise NotImplementedError
+
+    def get_meta(self, key, default=None):
+        raise NotImplementedError
+
+    def set_meta(self, key, value):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class SqliteStore(ComplaintStore):
+    """Embedded SQLite backend in WAL mode.
+
+    A submission is a single-row INSERT, so its cost does not depend on how
+    many complaints are already stored.
+
+    Rows are partitioned by the month their tracking ID was issued in and by
+    Department. ``partition_stats`` is the partition catalog: per-partition
+    counters that let queries skip months which cannot match. Past months
+    can be compacted into Parquet files; their counters stay in the catalog.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        self._init_schema()
+
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None,
+                                   check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _transaction(self):
+        conn = self._connect()
+        with self._write_lock:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def _init_schema(self):
+        with self._transaction() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS complaints (
+                    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                    ID INTEGER NOT NULL,
+                    Name TEXT,
+                    Category TEXT,
+                    Department TEXT,
+                    Priority TEXT,
+                    Status TEXT,
+                    Description TEXT,
+                    Sentiment TEXT,
+                    Image TEXT,
+                    Month TEXT
+                )
+            """)
+            columns = {row["name"] for row in conn.execute("PRAGMA table_info(complaints)")}
+            if "Month" not in columns:
+                conn.execute("ALTER TABLE complaints ADD COLUMN Month TEXT")
+                conn.executemany(
+                    "UPDATE complaints SET Month = ? WHERE seq = ?",
+                    ((id_month(row["ID"]), row["seq"])
+                     for row in conn.execute("SELECT seq, ID FROM complaints").fetchall())
+                )
+            # ID -> row index, kept up to date by SQLite on every insert
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_complaints_id ON complaints (ID)")
+            for col in FILTER_COLUMNS:
+                conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS idx_complaints_{col.lower()} "
+                    f"ON complaints ({col}, ID)"
+                )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_complaints_month ON complaints (Month, Department, ID)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)"
+            )
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS status_events (
+                    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                    ID INTEGER NOT NULL,
+                    old_status TEXT,
+                    new_status TEXT NOT NULL,
+                    at REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_status_events_id ON status_events (ID)")
+            # Near-duplicate complaint -> first complaint of its cluster
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS duplicates (
+                    ID INTEGER PRIMARY KEY,
+                    parent INTEGER NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_duplicates_parent ON duplicates (parent)")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS partition_archives (
+                    month TEXT PRIMARY KEY,
+                    path TEXT NOT NULL,
+                    rows INTEGER NOT NULL,
+                    archived_at REAL NOT NULL
+                )
+            """)
+            search.create_index(conn)
+            aggregates.create_table(conn)
+            built = conn.execute(
+                "SELECT 1 FROM meta WHERE key = 'partition_stats_built'"
+            ).fetchone()
+            if not built:
+                aggregates.rebuild(conn)
+                conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('partition_stats_built', 1)"
+                )
+
+    def _insert(self, conn, records):
+        records = [dict(record, Month=id_month(record["ID"])) for record in records]
+        columns = COLUMNS + ["Month"]
+        rows = [tuple(record.get(col) for col in columns) for record in records]
+        placeholders = ", ".join("?" for _ in columns)
+        conn.executemany(
+            f"INSERT INTO complaints ({', '.join(columns)}) VALUES ({placeholders})",
+            rows
+        )
+        aggregates.apply_insert(conn, records)
+        metrics.inc("storage_bytes_written_total", metrics.payload_bytes(records))
+
+    def _update_field(self, conn, complaint_id, column, value):
+        row = conn.execute(
+            f"SELECT seq, Month, Department, {column} FROM complaints "
+            f"WHERE ID = ? ORDER BY seq LIMIT 1",
+            (complaint_id,)
+        ).fetchone()
+        if row is None:
+            return False
+        conn.execute(f"UPDATE complaints SET {column} = ? WHERE seq = ?", (value, row["seq"]))
+        aggregates.apply_change(conn, aggregates.partition_key(dict(row)), column, row[column], value)
+        return True
+
+    def _set_status(self, conn, complaint_id, status):
+        row = conn.execute(
+            "SELECT seq, Month, Department, Status FROM complaints WHERE ID = ? ORDER BY seq LIMIT 1",
+            (complaint_id,)
+        ).fetchone()
+        if row is None or row["Status"] not in lifecycle.allowed_from(status):
+            return False
+        conn.execute("UPDATE complaints SET Status = ? WHERE seq = ?", (status, row["seq"]))
+        conn.execute(
+            "INSERT INTO status_events (ID, old_status, new_status, at) VALUES (?, ?, ?, ?)",
+            (complaint_id, row["Status"], status, time.time())
+        )
+        aggregates.apply_change(conn, aggregates.partition_key(dict(row)), "Status", row["Status"], status)
+        return True
+
+    @metrics.timed("storage_op_seconds", op="append")
+    def append_many(self, records):
+        if not records:
+            return
+        with self._transaction() as conn:
+            self._insert(conn, records)
+
+    @metrics.timed("storage_op_seconds", op="import_batches")
+    def import_batches(self, batches, meta=None):
+        """Append every batch and set the ``meta`` keys in one commit.
+
+        An import that fails part-way leaves nothing behind, so it can simply
+        be run again. Returns the number of rows appended.
+        """
+        imported = 0
+        with self._transaction() as conn:
+            for records in batches:
+                if records:
+                    self._insert(conn, records)
+                    imported += len(records)
+            conn.executemany(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                [(key, str(value)) for key, value in (meta or {}).items()]
+            )
+        return imported
+
+    def iter_rows(self, include_archived=False):
+        """Every hot row in append order, then the compacted months if asked."""
+        cursor = self._connect().execute(
+            f"SELECT {', '.join(COLUMNS)} FROM complaints ORDER BY seq"
+        )
+        for row in cursor:
+            yield dict(row)
+        if include_archived:
+            for rows in self.iter_archived():
+                yield from rows
+
+    @metrics.timed("storage_op_seconds", op="load_since")
+    def load_since(self, after_seq, limit=None):
+        """Rows appended after ``after_seq`` plus the new high-water mark."""
+        cursor = self._connect().execute(
+            f"SELECT seq, {', '.join(COLUMNS)} FROM complaints WHERE seq > ? ORDER BY seq LIMIT ?",
+            (after_seq, -1 if limit is None else limit)
+        )
+        rows = []
+        last_seq = after_seq
+        for row in cursor:
+            row = dict(row)
+            last_seq = row.pop("seq")
+            rows.append(row)
+        metrics.inc("storage_bytes_read_total", metrics.payload_bytes(rows))
+        return rows, last_seq
+
+    @metrics.timed("storage_op_seconds", op="get")
+    def get(self, complaint_id):
+        row = self._connect().execute(
+            f"SELECT {', '.join(COLUMNS)} FROM complaints WHERE ID = ? ORDER BY seq LIMIT 1",
+            (complaint_id,)
+        ).fetchone()
+        if row is None:
+            return self._get_archived(complaint_id)
+        row = dict(row)
+        metrics.inc("storage_bytes_read_total", metrics.payload_bytes([row]))
+        return row
+
+    def _get_archived(self, complaint_id):
+        archive = self._connect().execute(
+            "SELECT path FROM partition_archives WHERE month = ?", (id_month(complaint_id),)
+        ).fetchone()
+        if archive is None:
+            return None
+        from hub import columnar
+
+        df = columnar.load(archive["path"], filters=[("ID", "==", int(complaint_id))])
+        if df.empty:
+            return None
+        row = {col: (None if value is None or value != value else value)
+               for col, value in df.iloc[0].to_dict().items()}
+        row["ID"] = int(row["ID"])
+        metrics.inc("storage_bytes_read_total", metrics.payload_bytes([row]))
+        return row
+
+    @staticmethod
+    def _where(filters=None, id_range=None, ids=None, extra=None, table="", months=None):
+        prefix = f"{table}." if table else ""
+        clauses, params = [], []
+        if months is not None:
+            clauses.append(f"{prefix}Month IN ({', '.join('?' for _ in months)})")
+            params.extend(months)
+        for col, values in (filters or {}).items():
+            if col not in FILTER_COLUMNS:
+                raise ValueError(f"Cannot filter by {col}")
+            if values:
+                clauses.append(f"{prefix}{col} IN ({', '.join('?' for _ in values)})")
+                params.extend(values)
+        low, high = id_range or (None, None)
+        if low is not None:
+            clauses.append("ID >= ?")
+            params.append(low)
+        if high is not None:
+            clauses.append("ID <= ?")
+            params.append(high)
+        if ids is not None:
+            clauses.append(f"ID IN ({', '.join('?' for _ in ids)})")
+            params.extend(ids)
+        if extra:
+            clauses.append(extra[0])
+            params.extend(extra[1])
+        return (f"WHERE {' AND '.join(clauses)}" if clauses else ""), params
+
+    def _prune(self, conn, filters=None, id_range=None, months=None):
+        """Hot months that can hold a match, or None if no month can be skipped.
+
+        Uses the partition catalog only: a month is kept when one of its
+        (month, department) partitions has a non-zero counter for every
+        filtered column and its months overlap ``id_range``.
+        """
+        active = {col: set(values) for col, values in (filters or {}).items() if values}
+        present = {}
+        for row in conn.execute(
+            "SELECT month, department, dimension, value FROM partition_stats "
+            "WHERE count > 0 AND month NOT IN (SELECT month FROM partition_archives)"
+        ):
+            partition = present.setdefault((row["month"], row["department"]), {})
+            partition.setdefault(row["dimension"], set()).add(row["value"])
+        hot = {month for month, _ in present}
+        low, high = id_range or (None, None)
+        first = id_month(low) if low is not None else ""
+        last = id_month(high) if high is not None else "9999-99"
+        candidates = {
+            month for (month, _), values in present.items()
+            if first <= month <= last and (months is None or month in months)
+            and all(values.get(col, set()) & wanted for col, wanted in active.items())
+        }
+        if candidates == hot and months is None:
+            return None
+        metrics.inc("partitions_pruned_total", len(hot - candidates))
+        return sorted(candidates)
+
+    @metrics.timed("storage_op_seconds", op="query")
+    def query(self, filters=None, id_range=None, sort_by="ID", descending=True,
+              limit=50, offset=0, preview_chars=None, months=None):
+        """One page of complaints plus the total number of matches.
+
+        ``filters`` maps a column in FILTER_COLUMNS to the values to keep,
+        ``id_range`` is an inclusive (low, high) pair where either end may be
+        None and ``months`` limits the result to those "YYYY-MM" partitions.
+        Only the requested page is read; Description is cut to
+        ``preview_chars`` characters when given. Compacted months are not
+        included.
+        """
+        if sort_by not in SORT_COLUMNS:
+            raise ValueError(f"Cannot sort by {sort_by}")
+        conn = self._connect()
+        months = self._prune(conn, filters, id_range, months)
+        if months == []:
+            return [], 0
+        where, params = self._where(filters, id_range, months=months)
+
+        columns = [
+            f"substr(Description, 1, {int(preview_chars)}) AS Description"
+            if col == "Description" and preview_chars else col
+            for col in COLUMNS
+        ]
+        direction = "DESC" if descending else "ASC"
+        # Same key order as the (column, ID) indexes (seq is their rowid), so
+        # SQLite walks an index instead of sorting the matches
+        order = [sort_by] + (["ID"] if sort_by != "ID" else []) + ["seq"]
+        rows = conn.execute(
+            f"SELECT {', '.join(columns)} FROM complaints {where} "
+            f"ORDER BY {', '.join(f'{col} {direction}' for col in order)} LIMIT ? OFFSET ?",
+            params + [int(limit), int(offset)]
+        ).fetchall()
+        total = conn.execute(f"SELECT COUNT(*) FROM complaints {where}", params).fetchone()[0]
+        rows = [dict(row) for row in rows]
+        metrics.inc("storage_bytes_read_total", metrics.payload_bytes(rows))
+        return rows, total
+
+    @metrics.timed("storage_op_seconds", op="search")
+    def search(self, text, filters=None, id_range=None, limit=50, offset=0, months=None):
+        """Complaints matching ``text``, best first, plus the total match count.
+
+        Matches Name, Department and Description; see ``search.to_match``
+        for the query syntax. ``filters``, ``id_range`` and ``months`` work
+        as in ``query``.
+        """
+        match = search.to_match(text)
+        conn = self._connect()
+        months = self._prune(conn, filters, id_range, months)
+        if not match or months == []:
+            return [], 0
+        where, params = self._where(
+            filters, id_range, extra=("complaints_fts MATCH ?", [match]), table="complaints",
+            months=months
+        )
+        # CROSS JOIN makes SQLite drive the lookup from the FTS index, not the filters
+        source = "complaints_fts CROSS JOIN complaints ON complaints.seq = complaints_fts.rowid"
+        columns = ", ".join(f"complaints.{col}" for col in COLUMNS if col != "Description")
+        rows = conn.execute(
+            f"SELECT {columns}, snippet(complaints_fts, 2, '**', '**', '…', 16) AS Description, "
+            f"bm25(complaints_fts) AS Rank FROM {source} {where} ORDER BY Rank LIMIT ? OFFSET ?",
+            params + [int(limit), int(offset)]
+        ).fetchall()
+        total = conn.execute(f"SELECT COUNT(*) FROM {source} {where}", params).fetchone()[0]
+        rows = [dict(row) for row in rows]
+        metrics.inc("storage_bytes_read_total", metrics.payload_bytes(rows))
+        return rows, total
+
+    def version(self):
+        """(generation, last seq): generation changes whenever existing rows change."""
+        row = self._connect().execute(
+            "SELECT (SELECT value FROM meta WHERE key = 'generation'), "
+            "(SELECT MAX(seq) FROM complaints)"
+        ).fetchone()
+        return int(row[0] or 0), row[1] or 0
+
+    def _bump_generation(self, conn):
+        conn.execute(
+            "INSERT INTO meta (key, value) VALUES ('generation', 1) "
+            "ON CONFLICT(key) DO UPDATE SET value = value + 1"
+        )
+
+    def update_status(self, complaint_id, status):
+        return self.write_batch([("status", (complaint_id, status))])[0]
+
+    @metrics.timed("storage_op_seconds", op="write_batch")
+    def write_batch(self, ops, isolate=False):
+        results = []
+        with self._transaction() as conn:
+            changed = False
+            for kind, payload in ops:
+                if isolate:
+                    conn.execute("SAVEPOINT write_op")
+                try:
+                    result = self._apply_op(conn, kind, payload)
+                except Exception as exc:
+                    if not isolate:
+                        raise
+                    conn.execute("ROLLBACK TO write_op")
+                    result = exc
+                if isolate:
+                    conn.execute("RELEASE write_op")
+                changed = changed or (result is True and kind not in ("insert", "duplicate"))
+                results.append(result)
+            if changed:
+                self._bump_generation(conn)
+        return results
+
+    def _apply_op(self, conn, kind, payload):
+        if kind == "insert":
+            self._insert(conn, [payload])
+            return True
+        if kind == "status":
+            return self._set_status(conn, *payload)
+        if kind == "duplicate":
+            conn.execute("INSERT OR REPLACE INTO duplicates (ID, parent) VALUES (?, ?)", payload)
+            return True
+        if kind in UPDATE_OPS:
+            complaint_id, value = payload
+            return self._update_field(conn, complaint_id, UPDATE_OPS[kind], value)
+        raise ValueError(f"Unknown write op: {kind}")
+
+    @metrics.timed("storage_op_seconds", op="bulk_transition")
+    def bulk_transition(self, status, ids=None, id_range=None, filters=None, months=None):
+        """Move every matching complaint to ``status`` in one transaction.
+
+        Complaints are selected by an ID list, an inclusive ID range, months
+        and/or the same filters as ``query``; rows whose current status
+        cannot move to ``status`` are left alone. Returns the number of
+        complaints moved.
+        """
+        if (ids is None and not any(id_range or ()) and not any((filters or {}).values())
+                and not months):
+            raise ValueError("Refusing to change the status of every complaint")
+        previous = lifecycle.allowed_from(status)
+        guard = (f"Status IN ({', '.join('?' for _ in previous)})", previous)
+        # Only partitions that still hold a complaint in a movable status
+        scope = dict(filters or {})
+        scope["Status"] = [s for s in previous if not scope.get("Status") or s in scope["Status"]]
+        ids = None if ids is None else list(ids)
+
+        moved_total = 0
+        now = time.time()
+        with self._transaction() as conn:
+            months = self._prune(conn, scope, id_range, months)
+            if months == []:
+                return 0
+            if ids is None:
+                wheres = [self._where(filters, id_range, extra=guard, months=months)]
+            else:
+                wheres = [
+                    self._where(filters, id_range, ids[i:i + ID_CHUNK], extra=guard, months=months)
+                    for i in range(0, len(ids), ID_CHUNK)
+                ]
+            for where, params in wheres:
+                moved = {
+                    ((month or "", department or ""), old): count
+                    for month, department, old, count in conn.execute(
+                        f"SELECT Month, Department, Status, COUNT(*) FROM complaints {where} "
+                        f"GROUP BY Month, Department, Status", params
+                    ).fetchall()
+                }
+                if not moved:
+                    continue
+                conn.execute(
+                    f"INSERT INTO status_events (ID, old_status, new_status, at) "
+                    f"SELECT ID, Status, ?, ? FROM complaints {where}",
+                    [status, now] + params
+                )
+                conn.execute(f"UPDATE complaints SET Status = ? {where}", [status] + params)
+                aggregates.apply_moves(conn, "Status", moved, status)
+                moved_total += sum(moved.values())
+            if moved_total:
+                self._bump_generation(conn)
+        return moved_total
+
+    def status_history(self, complaint_id):
+        return [dict(row) for row in self._connect().execute(
+            "SELECT old_status, new_status, at FROM status_events WHERE ID = ? ORDER BY seq",
+            (complaint_id,)
+        )]
+
+    @metrics.timed("storage_op_seconds", op="clusters")
+    def clusters(self, months=None, departments=None, limit=20):
+        """Largest near-duplicate clusters, keyed by their parent complaint.
+
+        ``Size`` counts the parent and every linked complaint, ``Open`` the
+        ones not yet resolved. ``months`` and ``departments`` scope by the
+        parent's partition.
+        """
+        where, params = self._where(
+            {"Department": departments or []}, months=months or None, table="p"
+        )
+        rows = self._connect().execute(
+            f"SELECT p.ID AS Parent, p.Department, p.Status, "
+            f"substr(p.Description, 1, 200) AS Description, COUNT(*) + 1 AS Size, "
+            f"COALESCE(SUM(m.Status != ?), 0) + (p.Status != ?) AS Open, MAX(d.ID) AS Latest "
+            f"FROM duplicates d JOIN complaints p ON p.ID = d.parent "
+            f"LEFT JOIN complaints m ON m.ID = d.ID {where} "
+            f"GROUP BY d.parent ORDER BY Open DESC, Size DESC, Latest DESC LIMIT ?",
+            [lifecycle.RESOLVED, lifecycle.RESOLVED] + params + [int(limit)]
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+    def cluster_members(self, parent_id):
+        """The parent ID followed by every complaint linked to it."""
+        return [parent_id] + [row[0] for row in self._connect().execute(
+            "SELECT ID FROM duplicates WHERE parent = ? ORDER BY ID", (parent_id,)
+        )]
+
+    def cluster_links(self, since_id=0):
+        """Complaint ID -> cluster parent for complaints with ID >= ``since_id``."""
+        return dict(self._connect().execute(
+            "SELECT ID, parent FROM duplicates WHERE ID >= ?", (since_id,)
+        ).fetchall())
+
+    def count(self):
+        return self._connect().execute("SELECT COUNT(*) FROM complaints").fetchone()[0]
+
+    def image_references(self):
+        """Stored image path -> number of complaints that use it, archives included."""
+        conn = self._connect()
+        references = dict(conn.execute(
+            "SELECT Image, COUNT(*) FROM complaints WHERE Image IS NOT NULL GROUP BY Image"
+        ).fetchall())
+        archives = [row["path"] for row in conn.execute("SELECT path FROM partition_archives")]
+        if archives:
+            from hub import columnar
+
+            for path in archives:
+                for image in columnar.load(path, ["Image"])["Image"].dropna():
+                    references[image] = references.get(image, 0) + 1
+        return references
+
+    @metrics.timed("storage_op_seconds", op="aggregates")
+    def aggregates(self, months=None, departments=None):
+        """Dashboard counters, summed over the given partitions when scoped."""
+        return aggregates.read(self._connect(), months, departments)
+
+    def partitions(self):
+        """The partition catalog: one entry per (month, department)."""
+        catalog = {}
+        for row in self._connect().execute(
+            "SELECT s.month, s.department, s.dimension, s.value, s.count, a.path "
+            "FROM partition_stats s LEFT JOIN partition_archives a ON a.month = s.month "
+            "WHERE s.dimension IN ('Total', 'Status') AND s.count > 0 "
+            "ORDER BY s.month, s.department"
+        ):
+            entry = catalog.setdefault((row["month"], row["department"]), {
+                "month": row["month"], "department": row["department"],
+                "rows": 0, "open": 0, "archive": row["path"]
+            })
+            if row["dimension"] == "Total":
+                entry["rows"] = row["count"]
+            elif row["value"] != lifecycle.RESOLVED:
+                entry["open"] += row["count"]
+        return list(catalog.values())
+
+    @metrics.timed("storage_op_seconds", op="compact")
+    def compact(self, month):
+        """Move a past month's rows into a Parquet archive; returns the row count.
+
+        Archived rows can no longer change status or be picked up by the
+        sentiment scorer, so a month is only compacted once every complaint
+        in it is resolved and scored. The month's counters stay in the
+        catalog, and ``get`` still finds archived complaints by ID. Writers
+        wait while the archive is written.
+        """
+        if month >= time.strftime("%Y-%m", time.gmtime()):
+            raise ValueError("Only past months can be compacted")
+        from hub import columnar
+
+        archive_dir = os.path.join(os.path.dirname(os.path.abspath(self.path)), ARCHIVE_DIR)
+        path = os.path.join(archive_dir, f"complaints-{month}.parquet")
+        with self._transaction() as conn:
+            if conn.execute("SELECT 1 FROM partition_archives WHERE month = ?", (month,)).fetchone():
+                raise ValueError(f"{month} is already compacted")
+            open_count, unscored = conn.execute(
+                "SELECT COALESCE(SUM(Status IS NOT ?), 0), COALESCE(SUM(Sentiment = 'Pending'), 0) "
+                "FROM complaints WHERE Month = ?",
+                (lifecycle.RESOLVED, month)
+            ).fetchone()
+            if open_count:
+                raise ValueError(f"{open_count} complaints from {month} are not resolved yet")
+            if unscored:
+                raise ValueError(f"{unscored} complaints from {month} are still awaiting a sentiment score")
+            cursor = conn.execute(
+                f"SELECT {', '.join(COLUMNS)} FROM complaints WHERE Month = ? ORDER BY seq", (month,)
+            )
+            os.makedirs(archive_dir, exist_ok=True)
+            rows = columnar.records_to_parquet(
+                ([dict(row) for row in batch] for batch in iter(lambda: cursor.fetchmany(50000), [])),
+                path
+            )
+            if not rows:
+                os.remove(path)
+                return 0
+            conn.execute("DELETE FROM complaints WHERE Month = ?", (month,))
+            conn.execute(
+                "INSERT INTO partition_archives (month, path, rows, archived_at) VALUES (?, ?, ?, ?)",
+                (month, path, rows, time.time())
+            )
+            self._bump_generation(conn)
+        return rows
+
+    def archived_months(self):
+        return [row["month"] for row in self._connect().execute(
+            "SELECT month FROM partition_archives ORDER BY month"
+        )]
+
+    def iter_archived(self, month=None, batch_size=50000):
+        """Rows of the compacted months (or just ``month``) in lists of up to ``batch_size``."""
+        from hub import columnar
+
+        sql = "SELECT path FROM partition_archives"
+        params = ()
+        if month is not None:
+            sql, params = sql + " WHERE month = ?", (month,)
+        paths = [row["path"] for row in self._connect().execute(sql + " ORDER BY month", params)]
+        for path in paths:
+            for rows in columnar.iter_records(path, batch_size):
+                metrics.inc("storage_bytes_read_total", metrics.payload_bytes(rows))
+                yield rows
+
+    @metrics.timed("storage_op_seconds", op="update_archived")
+    def update_archived(self, month, column, values):
+        """Set ``column`` on archived complaints of ``month``; ``values`` maps ID -> value.
+
+        Only the UPDATE_OPS columns can change once a month is compacted.
+        The Parquet file is rewritten and the month's counters moved while
+        writers wait; returns how many rows changed.
+        """
+        if column not in UPDATE_OPS.values():
+            raise ValueError(f"{column} cannot be changed in a compacted month")
+        from hub import columnar
+
+        with self._transaction() as conn:
+            archive = conn.execute(
+                "SELECT path FROM partition_archives WHERE month = ?", (month,)
+            ).fetchone()
+            if archive is None:
+                raise ValueError(f"{month} is not compacted")
+            # new value -> {(partition, old value): rows}
+            moves = {}
+
+            def batches():
+                for rows in columnar.iter_records(archive["path"]):
+                    for row in rows:
+                        value = values.get(row["ID"], row[column])
+                        if value != row[column]:
+                            moved = moves.setdefault(value, {})
+                            key = ((month, row["Department"] or ""), row[column])
+                            moved[key] = moved.get(key, 0) + 1
+                            row[column] = value
+                    yield rows
+
+            columnar.records_to_parquet(batches(), archive["path"])
+            for value, moved in moves.items():
+                aggregates.apply_moves(conn, column, moved, value)
+            changed = sum(sum(moved.values()) for moved in moves.values())
+            if changed:
+                self._bump_generation(conn)
+        return changed
+
+    def verify_aggregates(self, fix=False):
+        """Recount from scratch and diff against the stored counters."""
+        with self._transaction() as conn:
+            stored = aggregates.read(conn)
+            rebuilt = aggregates.rebuild(conn) if fix else aggregates.compute(conn)
+        return aggregates.diff(stored, rebuilt)
+
+    def get_meta(self, key, default=None):
+        row = self._connect().execute(
+            "SELECT value FROM meta WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row else default
+
+    def set_meta(self, key, value):
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, str(value))
+            )
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+BACKENDS = {
+    "sqlite": SqliteStore,
+}
+
+
+def open_store(path, backend="sqlite"):
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown storage backend: {backend}")
+    return BACKENDS[backend](path)
+
+
+# --- CSV compatibility ---
+def _clean(value):
+    return value if value not in ("", "nan", "None") else None
+
+
+def read_csv_records(csv_path):
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            record = {col: _clean(row.get(col, "")) for col in COLUMNS}
+            record["ID"] = int(float(record["ID"]))
+            yield record
+
+
+def migrate_csv(store, csv_path, batch_size=5000):
+    """Import the legacy complaints.csv once. Returns the number of rows imported."""
+    if store.get_meta("migrated_from") or not os.path.exists(csv_path):
+        return 0
+
+    def batches():
+        batch = []
+        for record in read_csv_records(csv_path):
+            batch.append(record)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        yield batch
+
+    # The marker is committed together with the rows, so a crash mid-import
+    # leaves no rows behind and the import is retried on the next start
+    return store.import_batches(batches(), meta={"migrated_from": os.path.abspath(csv_path)})
+
+
+def export_csv(store, csv_path):
+    tmp_path = csv_path + ".tmp"
+    exported = 0
+    with open(tmp_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=COLUMNS)
+        writer.writeheader()
+        for row in store.iter_rows(include_archived=True):
+            writer.writerow(row)
+            exported += 1
+    os.replace(tmp_path, csv_path)
+    return exported
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Complaint store maintenance")
+    parser.add_argument("--db", default="complaints.db")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("migrate").add_argument("csv_path", nargs="?", default="complaints.csv")
+    sub.add_parser("export").add_argument("csv_path")
+    sub.add_parser("verify-aggregates").add_argument(
+        "--fix", action="store_true", help="Rewrite the counters if they differ"
+    )
+    sub.add_parser("partitions", help="List the partition catalog")
+    compact = sub.add_parser("compact", help="Archive a past month to Parquet")
+    compact.add_argument("month", help="YYYY-MM")
+    args = parser.parse_args()
+
+    store = open_store(args.db)
+    if args.command == "migrate":
+        print(f"Imported {migrate_csv(store, args.csv_path)} complaints")
+    elif args.command == "export":
+        print(f"Exported {export_csv(store, args.csv_path)} complaints to {args.csv_path}")
+    elif args.command == "partitions":
+        for entry in store.partitions():
+            where = entry["archive"] or "hot"
+            print(f"{entry['month']}  {entry['department'] or '-':<12} "
+                  f"{entry['rows']:>9} rows {entry['open']:>9} open  {where}")
+    elif args.command == "compact":
+        try:
+            rows = store.compact(args.month)
+        except ValueError as e:
+            raise SystemExit(str(e))
+        print(f"Archived {rows} complaints from {args.month}")
+    else:
+        mismatches = store.verify_aggregates(fix=args.fix)
+        for dimension, value, stored, rebuilt in mismatches:
+            print(f"{dimension}={value!r}: stored {stored}, rebuilt {rebuilt}")
+        print("Aggregates OK" if not mismatches else
+              f"{len(mismatches)} mismatching counters" + (" (fixed)" if args.fix else ""))
+        if mismatches and not args.fix:
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+import argparse
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+CHUNK_SIZE = 1 << 20
+THUMBNAIL_SIZE = (320, 320)
+THUMBNAIL_QUALITY = 70
+
+
+class UploadStore:
+    """Content-addressed image storage with reference counts and thumbnails.
+
+    Uploads are streamed to a temp file while being hashed and then moved to
+    ``objects/<aa>/<sha256><ext>``; a second upload of the same bytes only
+    bumps the reference count. Thumbnails are written to ``thumbs/`` on a
+    background pool.
+    """
+
+    def __init__(self, root="uploads", thumbnail_workers=2):
+        self.root = root
+        for sub in ("objects", "thumbs", "tmp"):
+            os.makedirs(os.path.join(root, sub), exist_ok=True)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._thumbnails = ThreadPoolExecutor(thumbnail_workers, thread_name_prefix="thumbnail")
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS blobs (
+                    path TEXT PRIMARY KEY,
+                    size INTEGER NOT NULL,
+                    refs INTEGER NOT NULL
+                )
+            """)
+
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(os.path.join(self.root, "blobs.db"), timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def _object_path(self, digest, ext):
+        return os.path.join(self.root, "objects", digest[:2], digest + ext)
+
+    def thumbnail_path(self, path):
+        name = os.path.splitext(os.path.basename(path))[0]
+        return os.path.join(self.root, "thumbs", name[:2], name + ".jpg")
+
+    def save(self, fileobj, filename):
+        """Stream ``fileobj`` to disk and return the stored path."""
+        ext = os.path.splitext(filename)[1].lower()
+        tmp_path = os.path.join(self.root, "tmp", uuid.uuid4().hex)
+        digest = hashlib.sha256()
+        size = 0
+        with open(tmp_path, "wb") as out:
+            while True:
+                chunk = fileobj.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                digest.update(chunk)
+                out.write(chunk)
+                size += len(chunk)
+        path = self._object_path(digest.hexdigest(), ext)
+
+        with self._lock:
+            if os.path.exists(path):
+                os.remove(tmp_path)
+                os.utime(path)  # restarts gc's grace period for a re-uploaded orphan
+                created = False
+            else:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                os.replace(tmp_path, path)
+                created = True
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT INTO blobs (path, size, refs) VALUES (?, ?, 1) "
+                    "ON CONFLICT(path) DO UPDATE SET refs = refs + 1",
+                    (path, size)
+                )
+        if created or not os.path.exists(self.thumbnail_path(path)):
+            self._thumbnails.submit(self.make_thumbnail, path)
+        return path
+
+    def release(self, path):
+        """Undo one ``save`` whose complaint was never stored; gc removes the file."""
+        with self._lock, self._connect() as conn:
+            conn.execute("UPDATE blobs SET refs = refs - 1 WHERE path = ?", (path,))
+
+    def make_thumbnail(self, path):
+        try:
+            from PIL import Image
+        except ImportError:
+            return None
+        thumb = self.thumbnail_path(path)
+        os.makedirs(os.path.dirname(thumb), exist_ok=True)
+        with Image.open(path) as image:
+            image.thumbnail(THUMBNAIL_SIZE)
+            image.convert("RGB").save(thumb, "JPEG", quality=THUMBNAIL_QUALITY, optimize=True)
+        return thumb
+
+    def preview(self, path):
+        """Thumbnail if one has been generated, otherwise the original."""
+        thumb = self.thumbnail_path(path)
+        return thumb if os.path.exists(thumb) else path
+
+    def gc(self, references, dry_run=False, grace=3600):
+        """Delete files no complaint refers to and resync reference counts.
+
+        ``references`` maps stored image paths to how many complaints use
+        them. Paths are compared as absolute paths, and files modified in
+        the last ``grace`` seconds are kept, so an upload whose complaint
+        was saved after ``references`` was taken survives. Returns the list
+        of removed paths.
+        """
+        referenced = {os.path.abspath(p) for p in references}
+        keep_thumbs = {os.path.abspath(self.thumbnail_path(p)) for p in references}
+        root = os.path.abspath(self.root)
+        removed = []
+        now = time.time()
+        with self._lock:
+            for dirpath, _, filenames in os.walk(root):
+                for filename in filenames:
+                    path = os.path.join(dirpath, filename)
+                    rel = os.path.relpath(path, root)
+                    if rel.startswith("blobs.db"):
+                        continue
+                    if now - os.path.getmtime(path) <= grace:
+                        continue
+                    if rel.startswith("tmp" + os.sep):
+                        orphan = True
+                    elif rel.startswith("thumbs" + os.sep):
+                        orphan = path not in keep_thumbs
+                    else:
+                        orphan = path not in referenced
+                    if orphan:
+                        removed.append(path)
+                        if not dry_run:
+                            os.remove(path)
+            if not dry_run:
+                with self._connect() as conn:
+                    conn.execute("DELETE FROM blobs")
+                    conn.executemany(
+                        "INSERT INTO blobs (path, size, refs) VALUES (?, ?, ?)",
+                        [(p, os.path.getsize(p), n) for p, n in references.items()
+                         if os.path.exists(p)]
+                    )
+        return removed
+
+
+def main():
+    from hub.storage import open_store
+
+    parser = argparse.ArgumentParser(description="Remove uploads no complaint refers to")
+    parser.add_argument("--db", default="complaints.db")
+    parser.add_argument("--root", default="uploads")
+    parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument("--grace", type=int, default=3600,
+                        help="Keep files modified within this many seconds")
+    args = parser.parse_args()
+
+    uploads = UploadStore(args.root)
+    removed = uploads.gc(
+        open_store(args.db).image_references(), dry_run=args.dry_run, grace=args.grace
+    )
+    for path in removed:
+        print(("would remove " if args.dry_run else "removed ") + path)
+    print(f"{len(removed)} orphaned files")
+
+
+if __name__ == "__main__":
+    main()
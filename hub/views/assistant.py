@@ -0,0 +1,17 @@
+import streamlit as st
+
+from hub.resources import get_assistant, get_store
+
+
+def render(lang):
+    st.markdown(f'<h1 class="main-header">Digital Citizen Hub Assistant</h1>', unsafe_allow_html=True)
+
+    st.markdown('<div class="clean-card">', unsafe_allow_html=True)
+    st.write("How can I assist you today?")
+
+    user_input = st.text_input("Your question:")
+    if st.button("Submit") and user_input:
+        response = get_assistant().answer(user_input, lang, lookup=get_store().get)
+        st.write("**Assistant:**", response)
+
+    st.markdown("</div>", unsafe_allow_html=True)
@@ -0,0 +1,211 @@
+import os
+
+import pandas as pd
+import streamlit as st
+
+from hub.assets import text
+from hub.charts import category_pie, priority_bar
+from hub.resources import get_figure_cache, get_store, get_upload_store, get_writer
+from hub.status import IN_PROGRESS, PENDING, RESOLVED
+from hub.storage import COLUMNS, FILTER_COLUMNS, SORT_COLUMNS
+
+
+def render(lang):
+    store = get_store()
+    writer = get_writer()
+    upload_store = get_upload_store()
+    st.markdown(f'<h1 class="main-header">{text[lang]["dashboard_title"]}</h1>', unsafe_allow_html=True)
+
+    data_version = store.version()
+    catalog = store.partitions()
+    if catalog:
+        # Scope: (month, department) partitions the whole page works on
+        col1, col2 = st.columns(2)
+        with col1:
+            months = st.multiselect(
+                "Months (none = all)", sorted({p["month"] for p in catalog}, reverse=True)
+            )
+        with col2:
+            departments = st.multiselect(
+                "Departments (none = all)", sorted({p["department"] for p in catalog if p["department"]})
+            )
+        counts = store.aggregates(months=months, departments=departments)
+        scope = (tuple(months), tuple(departments))
+
+        # Metrics
+        total = counts["Total"]
+        resolved = counts["Status"].get(RESOLVED, 0)
+        in_progress = counts["Status"].get(IN_PROGRESS, 0)
+        pending = counts["Status"].get(PENDING, 0)
+    
+        col1, col2, col3, col4, col5 = st.columns(5)
+        with col1:
+            st.metric("Total Complaints", total)
+        with col2:
+            st.metric("Resolved", resolved)
+        with col3:
+            st.metric("In Progress", in_progress)
+        with col4:
+            st.metric("Pending", pending)
+        with col5:
+            high_priority = counts["Priority"].get("High", 0)
+            st.metric("High Priority", high_priority)
+    
+        # Charts
+        st.markdown('<div class="clean-card">', unsafe_allow_html=True)
+        st.subheader("Visual Insights")
+    
+        col1, col2 = st.columns(2)
+    
+        with col1:
+            fig1 = get_figure_cache().get("category", data_version, lambda: category_pie(counts), scope)
+            st.plotly_chart(fig1, use_container_width=True)
+        
+        with col2:
+            fig2 = get_figure_cache().get("priority", data_version, lambda: priority_bar(counts), scope)
+            st.plotly_chart(fig2, use_container_width=True)
+    
+        st.markdown("</div>", unsafe_allow_html=True)
+    
+        # Data Table
+        st.markdown('<div class="clean-card">', unsafe_allow_html=True)
+        st.subheader("Complaint Records")
+        record_filters = [col for col in FILTER_COLUMNS if col != "Department"]
+        filter_cols = st.columns(len(record_filters))
+        filters = {"Department": departments}
+        for col, column_name in zip(filter_cols, record_filters):
+            with col:
+                filters[column_name] = st.multiselect(column_name, sorted(v for v in counts[column_name] if v))
+    
+        col1, col2, col3, col4, col5 = st.columns(5)
+        with col1:
+            id_from = st.number_input("ID from", min_value=0, step=1, value=0)
+        with col2:
+            id_to = st.number_input("ID to (0 = any)", min_value=0, step=1, value=0)
+        with col3:
+            sort_by = st.selectbox("Sort by", SORT_COLUMNS)
+        with col4:
+            page_size = st.selectbox("Rows per page", [25, 50, 100, 250], index=1)
+        with col5:
+            page_number = st.number_input("Page", min_value=1, step=1, value=1)
+        descending = st.checkbox("Newest / highest first", value=True)
+    
+        records, matches = store.query(
+            filters=filters,
+            id_range=(id_from or None, id_to or None),
+            sort_by=sort_by,
+            descending=descending,
+            limit=page_size,
+            offset=(page_number - 1) * page_size,
+            preview_chars=200,
+            months=months or None
+        )
+        st.dataframe(pd.DataFrame(records, columns=COLUMNS), use_container_width=True)
+        first = (page_number - 1) * page_size + 1 if records else 0
+        st.caption(f"Showing {first}–{first + len(records) - 1 if records else 0} of {matches} matching complaints")
+        archived = sorted({p["month"] for p in catalog if p["archive"]})
+        if archived:
+            st.caption(f"Archived months ({', '.join(archived)}) are counted above but not listed; "
+                       f"track them by ID.")
+    
+        with_images = [r for r in records if r["Image"] and os.path.exists(r["Image"])]
+        if with_images:
+            with st.expander(f"Image previews ({len(with_images)})"):
+                st.image(
+                    [upload_store.preview(r["Image"]) for r in with_images],
+                    caption=[f"#{r['ID']}" for r in with_images],
+                    width=160
+                )
+        st.markdown("</div>", unsafe_allow_html=True)
+    
+        # Search
+        st.markdown('<div class="clean-card">', unsafe_allow_html=True)
+        st.subheader("Search Complaints")
+        search_text = st.text_input(
+            'Keywords or "exact phrase" (name, department, description; English or Urdu)'
+        )
+        if search_text.strip():
+            hits, hit_count = store.search(
+                search_text, filters=filters, id_range=(id_from or None, id_to or None),
+                limit=page_size, months=months or None
+            )
+            st.caption(f"{hit_count} complaints match (record filters applied)")
+            if hits:
+                for hit in hits:
+                    st.markdown(
+                        f"**#{hit['ID']}** · {hit['Department']} · {hit['Priority']} · "
+                        f"{hit['Status']}  \n{hit['Description']}"
+                    )
+        st.markdown("</div>", unsafe_allow_html=True)
+    
+        # Near-duplicate clusters
+        st.markdown('<div class="clean-card">', unsafe_allow_html=True)
+        st.subheader("Duplicate Clusters")
+        clusters = store.clusters(months=months, departments=departments)
+        if clusters:
+            st.dataframe(
+                pd.DataFrame(clusters, columns=["Parent", "Size", "Open", "Department", "Status", "Description"]),
+                use_container_width=True
+            )
+        else:
+            st.caption("No near-duplicate complaints in this scope.")
+        st.markdown("</div>", unsafe_allow_html=True)
+
+        # Resolution
+        st.markdown('<div class="clean-card">', unsafe_allow_html=True)
+        st.subheader("Complaint Resolution")
+        new_status = st.selectbox(text[lang]["status"], [RESOLVED, IN_PROGRESS])
+        mode = st.radio(
+            "Apply to",
+            ["Single ID", "Duplicate cluster", "ID list", "ID range", "All matching the record filters"],
+            horizontal=True
+        )
+        if mode == "Duplicate cluster":
+            cluster_parent = st.selectbox(
+                "Cluster (parent ID)", [c["Parent"] for c in clusters],
+                format_func=lambda parent: next(
+                    f"#{c['Parent']} · {c['Size']} complaints · {c['Open']} open"
+                    for c in clusters if c["Parent"] == parent
+                )
+            )
+        elif mode == "Single ID":
+            resolve_id = st.number_input("Enter Complaint ID", min_value=0, step=1)
+        elif mode == "ID list":
+            id_list = st.text_area("Complaint IDs (comma or newline separated)")
+        elif mode == "ID range":
+            col1, col2 = st.columns(2)
+            with col1:
+                range_from = st.number_input("From ID", min_value=0, step=1)
+            with col2:
+                range_to = st.number_input("To ID", min_value=0, step=1)
+    
+        button_label = text[lang]["resolved_btn"] if new_status == RESOLVED else f"Mark as {new_status}"
+        if st.button(button_label):
+            if mode == "Single ID":
+                if writer.update_status(int(resolve_id), new_status).result(timeout=10):
+                    st.success(f"Complaint #{resolve_id} marked as {new_status}")
+                else:
+                    st.error("Complaint not found or already past this status")
+            else:
+                try:
+                    if mode == "Duplicate cluster":
+                        moved = store.bulk_transition(
+                            new_status, ids=store.cluster_members(cluster_parent)
+                        ) if cluster_parent else 0
+                    elif mode == "ID list":
+                        ids = [int(x) for x in id_list.replace(",", " ").split()]
+                        moved = store.bulk_transition(new_status, ids=ids) if ids else 0
+                    elif mode == "ID range":
+                        moved = store.bulk_transition(new_status, id_range=(range_from, range_to))
+                    else:
+                        moved = store.bulk_transition(
+                            new_status, filters=filters, id_range=(id_from or None, id_to or None),
+                            months=months or None
+                        )
+                    st.success(f"{moved} complaints marked as {new_status}")
+                except ValueError as e:
+                    st.error(str(e))
+        st.markdown("</div>", unsafe_allow_html=True)
+    
+    else:
+        st.info("No complaints submitted yet.")
@@ -0,0 +1,51 @@
+import streamlit as st
+
+from hub.assets import text
+
+
+def render(lang):
+    # Hero Section
+    st.markdown(f'<h1 class="main-header">{text[lang]["title"]}</h1>', unsafe_allow_html=True)
+    st.markdown(f'<div class="sub-header">{text[lang]["subtitle"]}</div>', unsafe_allow_html=True)
+    st.markdown(f'<div class="mission-text">{text[lang]["mission"]}</div>', unsafe_allow_html=True)
+
+    # Action Buttons - Fixed using Streamlit buttons instead of HTML links
+    col1, col2 = st.columns(2)
+    with col1:
+        if st.button("Submit Complaint", use_container_width=True):
+            st.session_state.page = text[lang]["submit"]
+    with col2:
+        if st.button("Track Complaint", use_container_width=True):
+            st.session_state.page = text[lang]["track"]
+
+    # Divider
+    st.markdown("---")
+
+    # Features Section
+    st.markdown(f'<div class="section-title">{text[lang]["features"]}</div>', unsafe_allow_html=True)
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.markdown("""
+        <div style="text-align: center; padding: 2rem;">
+            <h3 style="color: #000000; margin-bottom: 1rem;">AI-Powered</h3>
+            <p style="color: #666666;">Smart complaint categorization and priority detection using artificial intelligence.</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        st.markdown("""
+        <div style="text-align: center; padding: 2rem;">
+            <h3 style="color: #000000; margin-bottom: 1rem;">Real-time Tracking</h3>
+            <p style="color: #666666;">Monitor your complaint status in real-time with transparent updates.</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col3:
+        st.markdown("""
+        <div style="text-align: center; padding: 2rem;">
+            <h3 style="color: #000000; margin-bottom: 1rem;">Multi-department</h3>
+            <p style="color: #666666;">Integrated system connecting all government departments for efficient resolution.</p>
+        </div>
+        """, unsafe_allow_html=True)
@@ -0,0 +1,39 @@
+import pandas as pd
+import streamlit as st
+
+from hub import metrics
+from hub.assets import text
+
+
+def _labels(labels):
+    return ", ".join(f"{k}={v}" for k, v in labels)
+
+
+def render(lang):
+    st.markdown(f'<h1 class="main-header">{text[lang]["metrics"]}</h1>', unsafe_allow_html=True)
+    counters, histograms = metrics.snapshot()
+
+    st.markdown('<div class="clean-card">', unsafe_allow_html=True)
+    st.subheader("Latency")
+    st.dataframe(pd.DataFrame([
+        {
+            "Metric": name, "Labels": _labels(labels), "Count": count,
+            "Mean (ms)": total / count * 1000 if count else 0.0,
+            "p50 ≤ (ms)": metrics.quantile(buckets, 0.5) * 1000,
+            "p95 ≤ (ms)": metrics.quantile(buckets, 0.95) * 1000,
+            "p99 ≤ (ms)": metrics.quantile(buckets, 0.99) * 1000,
+        }
+        for (name, labels), (buckets, total, count) in sorted(histograms.items())
+    ]), use_container_width=True)
+
+    st.subheader("Counters")
+    st.dataframe(pd.DataFrame([
+        {"Metric": name, "Labels": _labels(labels), "Value": value}
+        for (name, labels), value in sorted(counters.items())
+    ]), use_container_width=True)
+    st.markdown("</div>", unsafe_allow_html=True)
+
+    exposition = metrics.render_prometheus()
+    st.download_button("Download Prometheus metrics", exposition, file_name="metrics.prom")
+    with st.expander("Prometheus text format"):
+        st.code(exposition, language="text")
@@ -0,0 +1,84 @@
+import streamlit as st
+
+from hub.assets import text
+from hub.helpers import category_translation, department_mapping
+from hub.priority import detect_priority
+from hub.resources import (
+    get_duplicate_index, get_id_generator, get_sentiment_scorer, get_upload_store, get_writer
+)
+from hub.sentiment import PENDING
+
+
+def render(lang):
+    writer = get_writer()
+    id_generator = get_id_generator()
+    sentiment_scorer = get_sentiment_scorer()
+    upload_store = get_upload_store()
+    duplicate_index = get_duplicate_index()
+    st.markdown(f'<h1 class="main-header">{text[lang]["submit_title"]}</h1>', unsafe_allow_html=True)
+
+    st.markdown('<div class="clean-card">', unsafe_allow_html=True)
+
+    if lang == "اردو":
+        categories = ["بجلی", "پانی", "صحت", "سڑکیں", "صفائی", "دیگر"]
+    else:
+        categories = ["Electricity", "Water", "Health", "Roads", "Sanitation", "Other"]
+
+    with st.form("complaint_form"):
+        col1, col2 = st.columns(2)
+    
+        with col1:
+            name = st.text_input(text[lang]["name"])
+            category = st.selectbox(text[lang]["category"], categories)
+        
+        with col2:
+            image = st.file_uploader(text[lang]["image"], type=["jpg", "jpeg", "png"])
+    
+        description = st.text_area(text[lang]["description"], height=120)
+    
+        submitted = st.form_submit_button(text[lang]["submit_btn"])
+
+        if submitted and name and description:
+            tracking_id = id_generator.next_id()
+        
+            # Fixed category translation logic
+            if lang == "اردو":
+                category_en = category_translation.get(category, "Other")
+            else:
+                category_en = category
+        
+            dept = department_mapping.get(category_en, "Other")
+            priority = detect_priority(description)
+            sentiment = PENDING  # scored in the background by sentiment_scorer
+            status = "Pending"
+
+            if image:
+                image_path = upload_store.save(image, image.name)
+            else:
+                image_path = None
+
+            try:
+                writer.insert({
+                    "ID": tracking_id, "Name": name, "Category": category_en,
+                    "Department": dept, "Priority": priority, "Status": status,
+                    "Description": description, "Sentiment": sentiment, "Image": image_path
+                }).result(timeout=10)
+            except TimeoutError:
+                raise  # still queued, so the image may yet be referenced
+            except Exception:
+                # The complaint was rejected; drop the reference save() added
+                if image_path:
+                    upload_store.release(image_path)
+                raise
+            sentiment_scorer.submit(tracking_id, description)
+            duplicate = duplicate_index.check(tracking_id, dept, description)
+            if duplicate:
+                writer.link_duplicate(tracking_id, duplicate[0])
+
+            st.success(f"{text[lang]['success']} #{tracking_id}")
+            st.write(f"**Department:** {dept}")
+            st.write(f"**Priority:** {priority}")
+            if duplicate:
+                st.info(f"{text[lang]['duplicate']} #{duplicate[0]}")
+        
+    st.markdown("</div>", unsafe_allow_html=True)
@@ -0,0 +1,45 @@
+import time
+
+import streamlit as st
+
+from hub.assets import text
+from hub.resources import get_store
+
+
+def render(lang):
+    store = get_store()
+    st.markdown(f'<h1 class="main-header">{text[lang]["track_title"]}</h1>', unsafe_allow_html=True)
+
+    st.markdown('<div class="clean-card">', unsafe_allow_html=True)
+
+    complaint_id = st.text_input(text[lang]["track_input"])
+
+    if st.button(text[lang]["track_btn"]):
+        if complaint_id.strip():
+            try:
+                complaint = store.get(int(complaint_id.strip()))
+            except (ValueError, OverflowError):
+                complaint = None
+            
+            if complaint is not None:
+                st.success("Complaint details found:")
+            
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.write(f"**ID:** #{complaint['ID']}")
+                    st.write(f"**Department:** {complaint['Department']}")
+                    st.write(f"**Status:** {complaint['Status']}")
+                with col2:
+                    st.write(f"**Priority:** {complaint['Priority']}")
+                    st.write(f"**Sentiment:** {complaint['Sentiment']}")
+            
+                st.write(f"**Description:** {complaint['Description']}")
+            
+                for event in store.status_history(complaint["ID"]):
+                    changed_at = time.strftime("%Y-%m-%d %H:%M", time.gmtime(event["at"]))
+                    st.caption(f"{changed_at}: {event['old_status']} → {event['new_status']}")
+            
+            else:
+                st.error("Complaint not found")
+            
+    st.markdown("</div>", unsafe_allow_html=True)
@@ -0,0 +1,91 @@
+import atexit
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+_STOP = object()
+
+
+class GroupCommitWriter:
+    """Single in-process writer that batches pending writes into one commit.
+
+    Sessions enqueue inserts and status updates and get a ``Future`` back.
+    The writer thread waits up to ``flush_interval`` seconds (or until
+    ``max_batch`` ops are pending) and applies the whole batch in a single
+    transaction, so concurrent submissions share one durable commit.
+    Each op runs in its own savepoint, so an op that fails only fails its
+    own future and the rest of the batch is still committed.
+    """
+
+    def __init__(self, store, flush_interval=0.005, max_batch=500, max_queue=10000):
+        self.store = store
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._thread = threading.Thread(target=self._run, name="complaint-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def insert(self, record):
+        return self._submit("insert", record)
+
+    def update_status(self, complaint_id, status):
+        return self._submit("status", (complaint_id, status))
+
+    def update_sentiment(self, complaint_id, sentiment):
+        return self._submit("sentiment", (complaint_id, sentiment))
+
+    def link_duplicate(self, complaint_id, parent_id):
+        return self._submit("duplicate", (complaint_id, parent_id))
+
+    def _submit(self, kind, payload):
+        if not self._thread.is_alive():
+            raise RuntimeError("Complaint writer is closed")
+        future = Future()
+        self._queue.put((kind, payload, future))
+        return future
+
+    def _next_batch(self):
+        item = self._queue.get()
+        if item is _STOP:
+            return None
+        batch = [item]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.max_batch:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+            if item is _STOP:
+                self._queue.put(_STOP)
+                break
+            batch.append(item)
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            try:
+                results = self.store.write_batch(
+                    [(kind, payload) for kind, payload, _ in batch], isolate=True
+                )
+            except Exception as exc:
+                for _, _, future in batch:
+                    future.set_exception(exc)
+            else:
+                for (_, _, future), result in zip(batch, results):
+                    if isinstance(result, Exception):
+                        future.set_exception(result)
+                    else:
+                        future.set_result(result)
+
+    def close(self, timeout=5):
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
@@ -0,0 +1,64 @@
+import pytest
+
+from hub.assistant import FALLBACK, FAQ, NOT_FOUND, Assistant
+
+URDU = "اردو"
+COMPLAINT = {"ID": 123456789012, "Department": "WASA", "Priority": "High", "Status": "In Progress"}
+
+
+@pytest.fixture
+def assistant():
+    return Assistant()
+
+
+def lookup(complaint_id):
+    return COMPLAINT if complaint_id == COMPLAINT["ID"] else None
+
+
+@pytest.mark.parametrize("question", [
+    "what is the status of complaint 123456789012?",
+    "status of #123456789012 please",
+    "شکایت ۱۲۳۴۵۶۷۸۹۰۱۲ کی حالت کیا ہے",
+    "شکایت ١٢٣٤٥٦٧٨٩٠١٢",
+])
+def test_tracking_id_is_looked_up(assistant, question):
+    answer = assistant.answer(question, "English", lookup=lookup)
+    assert "#123456789012" in answer and "In Progress" in answer
+
+
+def test_unknown_tracking_id_gets_not_found(assistant):
+    assert assistant.answer("status 987654321098", URDU, lookup=lookup) == (
+        NOT_FOUND[URDU].format(ID=987654321098)
+    )
+
+
+def test_short_or_embedded_numbers_are_not_tracking_ids(assistant):
+    calls = []
+
+    def spy(complaint_id):
+        calls.append(complaint_id)
+
+    assistant.answer("I called 12345 times about block 42", "English", lookup=spy)
+    assistant.answer("reference ABC12345678901234567", "English", lookup=spy)
+    assert calls == []
+
+
+def test_faq_answers_in_the_page_language(assistant):
+    assert assistant.answer("how do I track my complaint", "English") == FAQ[1]["English"]
+    assert assistant.answer("تصویر اپ لوڈ", URDU) == FAQ[5][URDU]
+    # Without a lookup a tracking ID question still gets the tracking FAQ
+    assert assistant.answer("track complaint 123456789012", "English") == FAQ[1]["English"]
+
+
+def test_unmatched_or_weak_questions_fall_back(assistant):
+    assert assistant.answer("what is the weather tomorrow", "English") == FALLBACK["English"]
+    assert assistant.answer("", URDU) == FALLBACK[URDU]
+    strict = Assistant(min_score=100)
+    assert strict.answer("how do I track my complaint", "English") == FALLBACK["English"]
+
+
+def test_cache_is_bounded():
+    small = Assistant(cache_size=2)
+    for question in ["track complaint", "upload photo", "change language"]:
+        small.answer(question, "English")
+    assert len(small._cache) == 2
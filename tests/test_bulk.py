@@ -0,0 +1,37 @@
+import json
+
+import pytest
+
+from hub.bulk import enrich, import_file, normalize_status
+from hub.ids import IdGenerator
+from hub.storage import open_store
+
+
+@pytest.mark.parametrize("value, expected", [
+    (None, "Pending"), ("", "Pending"), ("resolved", "Resolved"), ("IN_PROGRESS", "In Progress"),
+    ("in progress", "In Progress"), ("Closed", None), ("done", None),
+])
+def test_normalize_status(value, expected):
+    assert normalize_status(value) == expected
+
+
+def test_enrich_drops_rows_with_unknown_status():
+    rows = enrich([
+        {"Name": "a", "Description": "no water", "Status": "resolved"},
+        {"Name": "b", "Description": "no power", "Status": "Closed"},
+        {"Name": "c", "Description": "road broken"},
+    ], score_sentiment=False)
+    assert [(row["Name"], row["Status"]) for row in rows] == [("a", "Resolved"), ("c", "Pending")]
+
+
+def test_import_reports_rejected_rows(tmp_path):
+    path = tmp_path / "in.jsonl"
+    path.write_text("\n".join(json.dumps(row) for row in [
+        {"Name": "a", "Description": "no water", "Status": "Resolved"},
+        {"Name": "b", "Description": "no power", "Status": "Closed"},
+    ]))
+    store = open_store(str(tmp_path / "c.db"))
+    ids = IdGenerator(lock_dir=str(tmp_path / ".ids"))
+    assert import_file(store, str(path), processes=1, score_sentiment=False,
+                       id_generator=ids) == (1, 1)
+    assert store.aggregates()["Status"] == {"Resolved": 1}
@@ -0,0 +1,65 @@
+import time
+
+from hub.dedup import DuplicateIndex
+from hub.ids import first_id_at
+from hub.storage import open_store
+
+TEXT = "Water supply has been cut off in Gulberg block 4 since Monday morning"
+NEAR = "Water suply has been cut off in Gulberg block 4 since monday morning!!"
+OTHER = "Street lights on the main boulevard have not worked for two weeks now"
+
+
+def make_id(seconds_ago, sequence=0):
+    return first_id_at(time.time() - seconds_ago) + sequence
+
+
+def test_near_duplicate_links_to_the_cluster_parent():
+    index = DuplicateIndex()
+    first, second, third = make_id(30, 0), make_id(20, 0), make_id(10, 0)
+    assert index.check(first, "WASA", TEXT) is None
+    parent, score = index.check(second, "WASA", NEAR)
+    assert parent == first and score >= index.threshold
+    # A third copy that is closest to the second still joins the first's cluster
+    assert index.check(third, "WASA", NEAR)[0] == first
+    assert index.check(make_id(5), "WASA", OTHER) is None
+    assert index.stats["matches"] == 2
+
+
+def test_departments_are_separate_namespaces():
+    index = DuplicateIndex()
+    index.check(make_id(20), "WASA", TEXT)
+    assert index.check(make_id(10), "LESCO", TEXT) is None
+    assert index.check(make_id(5), "WASA", TEXT) is not None
+
+
+def test_old_and_surplus_entries_are_evicted():
+    index = DuplicateIndex(window=3600, max_entries=3)
+    index.check(make_id(7200), "WASA", TEXT)
+    # Evicted before the next check compares against it
+    assert index.check(make_id(200), "WASA", TEXT) is None
+    assert len(index) == 1
+    for n in range(4):
+        index.check(make_id(100 - n), "WASA", f"{OTHER} {n}")
+    assert len(index) == 3
+    assert index.stats["evicted"] == 3
+
+    index.check(make_id(60), "WASA", TEXT)
+    index.evict(now=time.time() + 3600)
+    assert len(index) == 0
+
+
+def test_warm_restores_indexed_complaints_and_their_links(tmp_path):
+    store = open_store(str(tmp_path / "complaints.db"))
+    first, second, stale = make_id(30), make_id(20), make_id(10 * 86400)
+    store.append_many([
+        {"ID": stale, "Department": "WASA", "Description": OTHER},
+        {"ID": first, "Department": "WASA", "Description": TEXT},
+        {"ID": second, "Department": "WASA", "Description": NEAR},
+    ])
+    store.write_batch([("duplicate", (second, first))])
+
+    index = DuplicateIndex()
+    assert index.warm(store) == 2
+    # The new copy is closest to the second complaint but joins the restored cluster
+    assert index.check(make_id(5), "WASA", NEAR)[0] == first
+    assert index.check(make_id(4), "WASA", OTHER) is None
@@ -0,0 +1,153 @@
+import calendar
+import time
+
+import pytest
+
+from hub.bulk import export_file
+from hub.ids import EPOCH_MS, SEQUENCE_BITS, WORKER_BITS
+from hub.priority import PriorityClassifier, reclassify_store
+from hub.status import IN_PROGRESS, PENDING, RESOLVED
+from hub.storage import export_csv, open_store
+
+CURRENT = time.strftime("%Y-%m", time.gmtime())
+
+
+def make_id(month, sequence):
+    year, mon = map(int, month.split("-"))
+    ms = calendar.timegm((year, mon, 15, 12, 0, 0)) * 1000
+    return ((ms - EPOCH_MS) << (WORKER_BITS + SEQUENCE_BITS)) | sequence
+
+
+def record(month, sequence, department, status=PENDING, image=None):
+    return {
+        "ID": make_id(month, sequence), "Name": f"Citizen {sequence}", "Category": "Water",
+        "Department": department, "Priority": "Low", "Status": status,
+        "Description": f"no water in block {sequence}", "Sentiment": "Pending", "Image": image
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = open_store(str(tmp_path / "complaints.db"))
+    store.append_many(
+        [record("2025-01", i, "WASA", image="uploads/objects/ab/old.png" if i == 0 else None)
+         for i in range(10)]
+        + [record("2025-02", i, "QESCO") for i in range(10)]
+        + [record(CURRENT, i, dept) for i, dept in enumerate(["WASA", "QESCO"] * 5)]
+    )
+    return store
+
+
+def recount(store, month):
+    """Status counts for ``month`` straight from the rows."""
+    rows, _ = store.query(months=[month], limit=1000)
+    counts = {}
+    for row in rows:
+        counts[row["Status"]] = counts.get(row["Status"], 0) + 1
+    return counts
+
+
+def score(store, month):
+    store.write_batch([("sentiment", (make_id(month, i), "Neutral")) for i in range(10)])
+
+
+def test_counters_match_rows_after_every_kind_of_write(store):
+    assert store.verify_aggregates() == []
+    assert store.update_status(make_id("2025-01", 0), IN_PROGRESS)
+    store.write_batch([
+        ("sentiment", (make_id("2025-01", 1), "Negative")),
+        ("priority", (make_id("2025-02", 1), "High")),
+        ("status", (make_id(CURRENT, 2), RESOLVED)),
+    ])
+    assert store.bulk_transition(RESOLVED, months=["2025-01"]) == 10
+    assert store.bulk_transition(IN_PROGRESS, filters={"Department": ["QESCO"]}) == 15
+    assert store.bulk_transition(RESOLVED, ids=[make_id(CURRENT, i) for i in range(10)]) == 9
+
+    assert store.verify_aggregates() == []
+    for month in ("2025-01", "2025-02", CURRENT):
+        assert store.aggregates(months=[month])["Status"] == recount(store, month)
+    assert store.aggregates(months=["2025-02"])["Priority"] == {"Low": 9, "High": 1}
+    assert store.aggregates(months=["2025-01"], departments=["WASA"])["Sentiment"] == {
+        "Pending": 9, "Negative": 1
+    }
+
+
+def test_pruning_with_filters_and_id_range_keeps_matching_months(store):
+    store.bulk_transition(RESOLVED, months=["2025-02", CURRENT])
+    id_range = (make_id("2025-01", 0), make_id(CURRENT, 0))
+
+    rows, total = store.query(filters={"Status": [PENDING]}, id_range=id_range, limit=100)
+    assert total == 10
+    assert {row["ID"] for row in rows} == {make_id("2025-01", i) for i in range(10)}
+
+    _, total = store.query(filters={"Status": [PENDING]}, id_range=(make_id("2025-02", 0), None))
+    assert total == 0
+    _, total = store.query(filters={"Department": ["QESCO"]}, months=["2025-01", "2025-02"])
+    assert total == 10
+    assert store.search("water", filters={"Status": [PENDING]}, id_range=id_range)[1] == 10
+
+
+def test_compact_archives_a_resolved_month(store):
+    pytest.importorskip("pyarrow")
+    pytest.importorskip("pandas")
+    with pytest.raises(ValueError):
+        store.compact(CURRENT)
+    with pytest.raises(ValueError):
+        store.compact("2025-01")  # still Pending
+    store.bulk_transition(RESOLVED, months=["2025-01"])
+    score(store, "2025-01")
+    before = store.aggregates()
+
+    assert store.compact("2025-01") == 10
+    assert store.count() == 20
+    assert store.aggregates() == before
+    assert store.aggregates(months=["2025-01"])["Total"] == 10
+    assert store.verify_aggregates() == []
+    assert store.verify_aggregates(fix=True) == []
+    assert store.aggregates() == before
+
+    archived = store.get(make_id("2025-01", 3))
+    assert archived["Name"] == "Citizen 3" and archived["Status"] == RESOLVED
+    assert archived["Image"] is None
+    assert store.get(make_id("2025-01", 99)) is None
+    assert store.image_references() == {"uploads/objects/ab/old.png": 1}
+    assert store.query(months=["2025-01"])[1] == 0
+    assert store.search("water")[1] == 20
+    assert [p["archive"] is not None for p in store.partitions()] == [True, False, False, False]
+    with pytest.raises(ValueError):
+        store.compact("2025-01")
+
+
+def test_exports_and_reclassify_include_archived_months(store, tmp_path):
+    pytest.importorskip("pyarrow")
+    pytest.importorskip("pandas")
+    store.bulk_transition(RESOLVED, months=["2025-01"])
+    score(store, "2025-01")
+    store.compact("2025-01")
+
+    assert export_csv(store, str(tmp_path / "all.csv")) == 30
+    assert export_file(store, str(tmp_path / "all.jsonl")) == 30
+    assert len(list(store.iter_rows())) == 20
+
+    classifier = PriorityClassifier(rules=[("High", 3, ["block"])])
+    assert reclassify_store(store, classifier) == 30
+    assert store.get(make_id("2025-01", 4))["Priority"] == "High"
+    assert store.aggregates(months=["2025-01"])["Priority"] == {"High": 10}
+    assert store.verify_aggregates() == []
+    assert reclassify_store(store, classifier) == 0
+    with pytest.raises(ValueError):
+        store.update_archived("2025-01", "Status", {})
+
+
+def test_compact_refuses_unresolved_or_unscored_rows(store):
+    pytest.importorskip("pyarrow")
+    pytest.importorskip("pandas")
+    store.bulk_transition(RESOLVED, ids=[make_id("2025-02", i) for i in range(9)])
+    with pytest.raises(ValueError, match="not resolved"):
+        store.compact("2025-02")
+    store.update_status(make_id("2025-02", 9), RESOLVED)
+    store.write_batch([("sentiment", (make_id("2025-02", i), "Neutral")) for i in range(9)])
+    with pytest.raises(ValueError, match="sentiment"):
+        store.compact("2025-02")
+    store.write_batch([("sentiment", (make_id("2025-02", 9), "Neutral"))])
+    assert store.compact("2025-02") == 10
@@ -0,0 +1,31 @@
+import pytest
+
+from hub.priority import PriorityClassifier, detect_priority
+
+
+@pytest.mark.parametrize("text_input, expected", [
+    ("broken and delayed, big problem", "Medium"),
+    ("problem problem problem", "Medium"),
+    ("urgently need help", "High"),
+    ("fires near house", "High"),
+    ("please fix immediately", "High"),
+    ("street light broken, fire risk", "High"),
+    ("پانی کی فراہمی میں تاخیر", "Medium"),
+    ("thank you for the new park", "Low"),
+    ("", "Low"),
+])
+def test_default_rules_pick_highest_matching_level(text_input, expected):
+    assert detect_priority(text_input) == expected
+
+
+def test_sum_mode_adds_weights():
+    classifier = PriorityClassifier(combine="sum")
+    assert classifier.classify("problem problem problem") == "High"
+    assert classifier.classify("problem") == "Medium"
+
+
+def test_classify_many_matches_classify():
+    texts = ["problem problem problem", "urgently need help", None, "nothing here",
+             "urgently need help", float("nan")]
+    classifier = PriorityClassifier()
+    assert classifier.classify_many(texts) == [classifier.classify(t) for t in texts[:5]] + ["Low"]
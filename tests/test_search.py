@@ -0,0 +1,53 @@
+import pytest
+
+from hub.search import to_match
+from hub.storage import open_store
+
+HOSTILE = ['NEAR(water', 'water AND market', 'water OR', '"unbalanced', '"', '***', '*',
+           'a"b', '-water', 'col:water', '^water', '(', '+', '" "', '']
+
+
+@pytest.mark.parametrize("query, expected", [
+    ("water", '"water"'),
+    ('"no water" market', '"no water" "market"'),
+    ("wat*", '"wat"*'),
+    ("water AND market", '"water" "AND" "market"'),
+    ("NEAR(water", '"NEAR(water"'),
+    ('"unbalanced', '"unbalanced"'),
+    ('a"b', '"ab"'),
+    ('"', ""),
+    ("   ", ""),
+    ("پانی فراہم*", '"پانی" "فراہم"*'),
+])
+def test_to_match_quotes_every_term(query, expected):
+    assert to_match(query) == expected
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = open_store(str(tmp_path / "complaints.db"))
+    store.append_many([
+        {"ID": 1, "Department": "WASA", "Description": "no water in block 4 near the market"},
+        {"ID": 2, "Department": "WASA", "Description": "water pressure is low"},
+        {"ID": 3, "Department": "WASA", "Description": "پانی کی فراہمی میں تاخیر"},
+        {"ID": 4, "Department": "LESCO", "Description": "street light broken"},
+    ])
+    return store
+
+
+def found(store, query):
+    rows, _ = store.search(query)
+    return sorted(row["ID"] for row in rows)
+
+
+def test_search_phrases_prefixes_and_urdu(store):
+    assert found(store, "water") == [1, 2]
+    assert found(store, '"no water"') == [1]
+    assert found(store, "wat* low") == [2]
+    assert found(store, "پانی") == [3]
+    assert found(store, "فراہم*") == [3]
+
+
+@pytest.mark.parametrize("query", HOSTILE)
+def test_fts_syntax_in_input_never_raises(store, query):
+    store.search(query)
@@ -0,0 +1,48 @@
+from hub import sentiment
+from hub.sentiment import PENDING, SentimentScorer
+from hub.storage import open_store
+
+
+class FakeWriter:
+    def __init__(self):
+        self.updates = []
+
+    def update_sentiment(self, complaint_id, label):
+        self.updates.append((complaint_id, label))
+
+
+def test_recover_pages_through_every_pending_complaint(tmp_path):
+    store = open_store(str(tmp_path / "c.db"))
+    store.append_many([
+        {"ID": i, "Department": "WASA", "Status": "Pending", "Description": f"text {i}",
+         "Sentiment": PENDING if i % 3 else "Neutral"}
+        for i in range(1, 101)
+    ])
+    scorer = SentimentScorer(FakeWriter())
+    queued = []
+    scorer.submit = lambda complaint_id, description: queued.append(complaint_id)
+    assert scorer.recover(store, page_size=7) == 67
+    assert queued == [i for i in range(1, 101) if i % 3]
+
+
+def test_scoring_failure_leaves_complaints_pending(monkeypatch, caplog):
+    def broken(*args, **kwargs):
+        raise LookupError("corpus missing")
+
+    monkeypatch.setattr(sentiment, "score_many", broken)
+    writer = FakeWriter()
+    SentimentScorer(writer)._process([(1, "no water"), (2, "no power")])
+    assert writer.updates == []
+    assert "Sentiment scoring failed for 2 complaints" in caplog.text
+
+
+def test_score_pending_scores_only_pending_complaints(tmp_path, monkeypatch):
+    monkeypatch.setattr(sentiment, "score_many", lambda texts, *args, **kwargs: ["Neutral"] * len(texts))
+    store = open_store(str(tmp_path / "c.db"))
+    store.append_many([
+        {"ID": i, "Department": "WASA", "Description": f"text {i}",
+         "Sentiment": PENDING if i % 2 else "Negative"}
+        for i in range(1, 21)
+    ])
+    assert sentiment.score_pending(store, processes=1, page_size=3) == 10
+    assert store.aggregates()["Sentiment"] == {"Neutral": 10, "Negative": 10}
@@ -0,0 +1,38 @@
+import pytest
+
+from hub.storage import COLUMNS, migrate_csv, open_store
+
+
+def write_csv(path, ids):
+    lines = [",".join(COLUMNS)]
+    lines += [f"{complaint_id},Citizen,Water,WASA,Low,Pending,no water,Neutral," for complaint_id in ids]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def test_migrate_csv_is_all_or_nothing(tmp_path):
+    store = open_store(str(tmp_path / "complaints.db"))
+    csv_path = tmp_path / "complaints.csv"
+    write_csv(csv_path, [str(1000 + i) for i in range(12)] + ["not-an-id"])
+
+    with pytest.raises(ValueError):
+        migrate_csv(store, str(csv_path), batch_size=5)
+    assert store.count() == 0
+    assert store.get_meta("migrated_from") is None
+
+    write_csv(csv_path, [str(1000 + i) for i in range(12)])
+    assert migrate_csv(store, str(csv_path), batch_size=5) == 12
+    assert store.count() == 12
+    assert store.aggregates()["Total"] == 12
+    assert migrate_csv(store, str(csv_path)) == 0
+
+
+def test_query_breaks_sort_ties_by_id(tmp_path):
+    store = open_store(str(tmp_path / "complaints.db"))
+    store.append_many([
+        {"ID": complaint_id, "Status": status, "Department": "WASA"}
+        for complaint_id, status in [(5, "Pending"), (9, "Resolved"), (7, "Pending"), (6, "Resolved")]
+    ])
+    rows, _ = store.query(sort_by="Status", descending=True)
+    assert [row["ID"] for row in rows] == [9, 6, 7, 5]
+    rows, _ = store.query(sort_by="Status", descending=False)
+    assert [row["ID"] for row in rows] == [5, 7, 6, 9]
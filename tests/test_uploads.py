@@ -0,0 +1,35 @@
+import io
+import os
+import time
+
+from hub.uploads import UploadStore
+
+
+def age(path, seconds):
+    then = time.time() - seconds
+    os.utime(path, (then, then))
+
+
+def test_gc_compares_absolute_paths_and_keeps_recent_files(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    uploads = UploadStore("uploads")
+    kept = uploads.save(io.BytesIO(b"referenced"), "a.png")
+    orphan = uploads.save(io.BytesIO(b"orphan"), "b.png")
+    recent = uploads.save(io.BytesIO(b"uploaded during gc"), "c.png")
+    for path in (kept, orphan):
+        age(path, 7200)
+
+    # Stored paths are relative; the CLI may be given an absolute root
+    removed = UploadStore(str(tmp_path / "uploads")).gc({kept: 1})
+
+    assert removed == [os.path.abspath(orphan)]
+    assert os.path.exists(kept) and os.path.exists(recent)
+
+
+def test_release_undoes_one_save(tmp_path):
+    store = UploadStore(str(tmp_path / "uploads"))
+    path = store.save(io.BytesIO(b"png bytes"), "photo.PNG")
+    assert store.save(io.BytesIO(b"png bytes"), "photo.png") == path
+    store.release(path)
+    refs = store._connect().execute("SELECT refs FROM blobs WHERE path = ?", (path,)).fetchone()[0]
+    assert refs == 1
@@ -0,0 +1,36 @@
+import pytest
+
+from hub.status import PENDING
+from hub.storage import open_store
+from hub.writer import GroupCommitWriter
+
+
+def record(complaint_id):
+    return {
+        "ID": complaint_id, "Name": "n", "Category": "Water", "Department": "WASA",
+        "Priority": "Low", "Status": PENDING, "Description": "no water", "Sentiment": "Neutral",
+        "Image": None
+    }
+
+
+def test_failing_op_does_not_fail_its_batch(tmp_path):
+    store = open_store(str(tmp_path / "c.db"))
+    store.append(record(1))
+    writer = GroupCommitWriter(store, flush_interval=0.2)
+    try:
+        bad = writer.update_status(1, PENDING)  # nothing moves back to Pending
+        good = writer.insert(record(2))
+        with pytest.raises(ValueError):
+            bad.result(timeout=5)
+        assert good.result(timeout=5) is True
+    finally:
+        writer.close()
+    assert store.get(2)["ID"] == 2
+    assert store.verify_aggregates() == []
+
+
+def test_direct_write_batch_still_aborts_on_error(tmp_path):
+    store = open_store(str(tmp_path / "c.db"))
+    with pytest.raises(ValueError):
+        store.write_batch([("insert", record(1)), ("status", (1, PENDING))])
+    assert store.get(1) is None